@@ -0,0 +1,7 @@
+"""
+Offscreen benchmarks for the Truth Engine render paths.
+
+Run from the repository root, e.g.:
+    python -m benchmarks.bench_sprite_batch
+All benchmarks use the SDL dummy video driver, so no window is opened.
+"""
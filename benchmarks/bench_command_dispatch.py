@@ -0,0 +1,179 @@
+"""
+Command dispatch benchmark: the old if/elif command chain vs the CommandRegistry.
+
+LEGACY_CHAIN is the if/elif chain of the KEYDOWN handler as it was before
+the registry, written out branch by branch: its test (== / in /
+startswith()), the names it tested and the handler its body became. It is
+compiled back into an if/elif function for timing. The registry is built
+from COMMAND_TABLE and PREFIX_COMMAND_TABLE, read out of truth_engine_X10.py
+with ast (the game itself is not started). Every name of the chain (prefixes
+with an argument appended) plus an unknown command is resolved both ways,
+and both must pick the same handler for every input; commands registered
+after the chain existed are listed but not compared.
+
+Usage:
+    python -m benchmarks.bench_command_dispatch [--repeat 2000]
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import time
+
+from command_registry import CommandRegistry
+
+ENGINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "truth_engine_X10.py")
+PREFIX_ARGUMENTS = {"#": "truth", "read_charge": " 2", "sigil": " 1", "search ": "truth",
+                    "essay ": "019", "search_essays ": "legal"}
+UNKNOWN = "not_a_command"
+
+# The pre-registry chain, in branch order: (test, names, handler the branch body moved to)
+LEGACY_CHAIN = [
+    ("startswith", ("#",), "command_lore_search"),
+    ("==", ("omega_override",), "command_omega_override"),
+    ("==", ("void_fiction",), "command_void_fiction"),
+    ("==", ("dossier_status",), "command_dossier_status"),
+    ("startswith", ("read_charge",), "command_read_charge"),
+    ("==", ("execute wr_mega",), "command_execute_wr_mega"),
+    ("==", ("lock_bccrss_protocol",), "command_lock_bccrss_protocol"),
+    ("==", ("burn_fake_identity",), "command_burn_fake_identity"),
+    ("==", ("trigger_mirror_cascade",), "command_trigger_mirror_cascade"),
+    ("==", ("redeem_soul_77",), "command_redeem_soul_77"),
+    ("==", ("show_ptensor",), "command_show_ptensor"),
+    ("==", ("quantify_anomaly",), "command_quantify_anomaly"),
+    ("in", ("gridbleed", "grid_bleed"), "command_gridbleed"),
+    ("in", ("anomaly", "grid_anomaly"), "command_anomaly"),
+    ("==", ("node_map",), "command_node_map"),
+    ("in", ("ai_awareness", "ai_protocol"), "command_ai_awareness"),
+    ("in", ("recursive_feedback", "recursive"), "command_recursive_feedback"),
+    ("==", ("qtensor",), "command_qtensor"),
+    ("==", ("deepmind",), "command_deepmind"),
+    ("==", ("centrality",), "command_centrality"),
+    ("startswith", ("sigil",), "command_sigil"),
+    ("==", ("show_bccrss",), "command_show_bccrss"),
+    ("==", ("judge_bows",), "command_judge_bows"),
+    ("in", ("jane_doe-755", "janedoe-755", "janedoe755", "jane_doe755"), "command_jane_doe_755"),
+    ("in", ("crss", "invoke_crss"), "command_crss"),
+    ("==", ("freeman",), "command_freeman"),
+    ("==", ("sovereign",), "command_sovereign"),
+    ("==", ("show_grid_bleed",), "command_show_grid_bleed"),
+    ("==", ("show_fractures",), "command_show_fractures"),
+    ("==", ("network_status",), "command_network_status"),
+    ("==", ("show_consensus",), "command_show_consensus"),
+    ("==", ("list_ai_nodes",), "command_list_ai_nodes"),
+    ("startswith", ("search ",), "command_search"),
+    ("==", ("help",), "command_help"),
+    ("==", ("essays",), "command_essays"),
+    ("in", ("open_essays", "essays_screen", "essay_screen"), "command_open_essays"),
+    ("in", ("history_log", "log", "show_log", "open_log", "history"), "command_history_log"),
+    ("startswith", ("essay ",), "command_essay"),
+    ("startswith", ("search_essays ",), "command_search_essays"),
+    ("in", ("reset_context", "clear_context", "reset_window"), "command_reset_context"),
+    ("in", ("fullscreen", "expand_context", "context_fullscreen"), "command_fullscreen"),
+    ("==", ("font_stats",), "command_font_stats"),
+    ("==", ("dirty_rects",), "command_dirty_rects"),
+    ("==", ("surface_stats",), "command_surface_stats"),
+    ("==", ("perf",), "command_perf"),
+    ("in", ("next_hit", "prev_hit"), "command_next_hit"),
+    ("==", ("crew",), "command_crew"),
+    ("==", ("save",), "command_save"),
+    ("in", ("reset", "reset_game", "new_game"), "command_reset"),
+    ("==", ("execute_final_verdict_91xvoid",), "command_execute_final_verdict_91xvoid"),
+]
+
+
+def load_tables(path=ENGINE_PATH):
+    """[(names, handler name, prefix)] of the rows of the engine command tables."""
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    rows = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            name = getattr(node.targets[0], "id", None)
+            if name in ("COMMAND_TABLE", "PREFIX_COMMAND_TABLE"):
+                for row in node.value.elts:
+                    names = ast.literal_eval(row.elts[0])
+                    rows.append((names, row.elts[1].id, name == "PREFIX_COMMAND_TABLE"))
+    return rows
+
+
+def compile_chain(chain=LEGACY_CHAIN):
+    """The old dispatch as a function: chain written out as one if/elif chain returning handler names."""
+    lines = ["def resolve_chain(cmd_lower):"]
+    for i, (test, names, handler) in enumerate(chain):
+        keyword = "if" if i == 0 else "elif"
+        if test == "startswith":
+            condition = f"cmd_lower.startswith({names[0]!r})"
+        elif test == "==":
+            condition = f"cmd_lower == {names[0]!r}"
+        else:
+            condition = f"cmd_lower in {list(names)!r}"
+        lines.append(f"    {keyword} {condition}:")
+        lines.append(f"        return {handler!r}")
+    lines.append("    return None")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["resolve_chain"]
+
+
+def build_registry(rows):
+    registry = CommandRegistry()
+    for names, handler, prefix in rows:
+        registry.register(names, handler, prefix=prefix)
+    return registry
+
+
+def command_inputs():
+    """Every name the legacy chain tested (prefixes with an argument), plus an unknown command."""
+    inputs = []
+    for test, names, handler in LEGACY_CHAIN:
+        for name in names:
+            inputs.append(name + PREFIX_ARGUMENTS.get(name, "") if test == "startswith" else name)
+    inputs.append(UNKNOWN)
+    return inputs
+
+
+def time_dispatch(repeat, inputs, resolve):
+    per_input = {}
+    for text in inputs:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            resolve(text)
+        per_input[text] = (time.perf_counter() - start) * 1e9 / repeat
+    return per_input
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = load_tables()
+    registry = build_registry(rows)
+    inputs = command_inputs()
+    resolve_chain = compile_chain()
+    for text in inputs:
+        command, _ = registry.resolve(text)
+        assert resolve_chain(text) == (command.handler if command else None), text
+    legacy_handlers = {handler for _, _, handler in LEGACY_CHAIN}
+    added = [names[0] for names, handler, _ in rows if handler not in legacy_handlers]
+    if added:
+        print(f"registered after the chain (not compared): {', '.join(added)}")
+
+    chain = time_dispatch(args.repeat, inputs, resolve_chain)
+    table = time_dispatch(args.repeat, inputs, registry.resolve)
+    worst_chain = max(chain, key=chain.get)
+    worst_table = max(table, key=table.get)
+    stats = registry.stats()
+    print(f"registry: {stats['commands']} handlers, {stats['names']} names, {stats['prefixes']} prefixes; "
+          f"{len(inputs)} inputs x {args.repeat}")
+    print(f"elif chain   {statistics.mean(chain.values()):8.1f} ns/command "
+          f"(worst {chain[worst_chain]:.1f} ns: {worst_chain!r})")
+    print(f"registry     {statistics.mean(table.values()):8.1f} ns/command "
+          f"(worst {table[worst_table]:.1f} ns: {worst_table!r})   "
+          f"speedup x{statistics.mean(chain.values()) / statistics.mean(table.values()):.2f}")
+
+
+if __name__ == "__main__":
+    main()
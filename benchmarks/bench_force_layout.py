@@ -0,0 +1,220 @@
+"""
+Force layout benchmark: the node map's per-pair Python loops vs ForceLayout.
+
+Builds random graphs shaped like the node map (a central anchor node, nodes
+seeded on a ring, labelled collision radii, random links) and times one
+simulation iteration done the legacy way (dict of forces, nested loops over
+every pair of names, the collision radius re-measured by rendering the label
+for every pair) against ForceLayout with all-pairs arrays (NumPy, or the
+pure-Python fallback) and with the Barnes–Hut quadtree.
+
+Before timing, the 21-node graph of the node map is stepped by every
+implementation from the same start and the resulting positions are checked
+against the legacy loop (Barnes–Hut with theta=0, which never approximates).
+
+Usage:
+    python -m benchmarks.bench_force_layout [--nodes 21,100,400,1500] [--iterations 5]
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # type: ignore
+
+import force_layout
+from force_layout import ForceLayout
+
+LEGACY_MAX_NODES = 400  # The legacy loop takes seconds per iteration beyond this
+# The legacy loop's constants, which the equivalence check needs (the node map now runs gentler ones)
+PARAMETERS = dict(charge_strength=-10000, link_distance=150, link_strength=0.2, collision_strength=5.0,
+                  center_strength=0.1, boundary_strength=15.0, alpha_decay=0.05, velocity_decay=0.5)
+
+
+def make_graph(count, links_per_node=3, seed=7):
+    """Node names, ring positions, links, bounds, center and exclusion rect of a node-map-like graph."""
+    rng = random.Random(seed)
+    names = ["BCCRSS KORE"] + [f"Node {i} " + "x" * rng.randint(0, 30) for i in range(1, count)]
+    side = max(600.0, math.sqrt(count) * 160.0)
+    bounds = (430.0, 50.0, 430.0 + side, 50.0 + side)
+    center = ((bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2)
+    positions = {names[0]: center}
+    for i, name in enumerate(names[1:]):
+        angle = math.radians(i * 360.0 / (count - 1))
+        positions[name] = (center[0] + side / 3 * math.cos(angle), center[1] + side / 3 * math.sin(angle))
+    links = [(name, rng.choice(names)) for name in names for _ in range(links_per_node)]
+    return names, positions, links, bounds, center, (290.0, 15.0, 90.0, 600.0)
+
+
+def label_radius(font, name):
+    """Collision radius from the rendered label, as the legacy get_node_collision_radius() measured it."""
+    surf = font.render(name, True, (255, 255, 255))
+    return max(5 + surf.get_width() + 40, 5 + surf.get_height() + 40, 80)
+
+
+def legacy_iterations(names, positions, velocities, links, radius_of, bounds, iterations, anchor, center, exclusion):
+    """The old node map simulation loop (collision radius looked up per pair)."""
+    left, top, right, bottom = bounds
+    egg_x, egg_y, egg_w, egg_h = exclusion
+    connections = {}
+    for a, b in links:
+        connections.setdefault(a, []).append(b)
+    for iteration in range(iterations):
+        forces = {node: [0.0, 0.0] for node in names}
+        for i, node1 in enumerate(names):
+            x1, y1 = positions[node1]
+            for j, node2 in enumerate(names):
+                if i >= j:
+                    continue
+                x2, y2 = positions[node2]
+                dx, dy = x1 - x2, y1 - y2
+                dist_sq = max(dx * dx + dy * dy, 0.01)
+                dist = math.sqrt(dist_sq)
+                magnitude = -10000 / dist_sq
+                forces[node1][0] += dx / dist * magnitude
+                forces[node1][1] += dy / dist * magnitude
+                forces[node2][0] -= dx / dist * magnitude
+                forces[node2][1] -= dy / dist * magnitude
+        for node1, connected in connections.items():
+            x1, y1 = positions[node1]
+            for node2 in connected:
+                x2, y2 = positions[node2]
+                dx, dy = x2 - x1, y2 - y1
+                dist = max(math.sqrt(dx * dx + dy * dy), 0.01)
+                magnitude = 0.2 * (dist - 150)
+                forces[node1][0] += dx / dist * magnitude
+                forces[node1][1] += dy / dist * magnitude
+                forces[node2][0] -= dx / dist * magnitude
+                forces[node2][1] -= dy / dist * magnitude
+        for i, node1 in enumerate(names):
+            x1, y1 = positions[node1]
+            radius1 = radius_of(node1)
+            for j, node2 in enumerate(names):
+                if i >= j:
+                    continue
+                x2, y2 = positions[node2]
+                radius2 = radius_of(node2)
+                dx, dy = x1 - x2, y1 - y2
+                dist_sq = dx * dx + dy * dy
+                min_dist = radius1 + radius2
+                if dist_sq < min_dist * min_dist * 4 and dist_sq > 0.01:
+                    dist = math.sqrt(dist_sq)
+                    if dist < min_dist:
+                        magnitude = (min_dist - dist) * 5.0
+                        forces[node1][0] += dx / dist * magnitude
+                        forces[node1][1] += dy / dist * magnitude
+                        forces[node2][0] -= dx / dist * magnitude
+                        forces[node2][1] -= dy / dist * magnitude
+        x, y = positions[anchor]
+        forces[anchor][0] += (center[0] - x) * 0.1
+        forces[anchor][1] += (center[1] - y) * 0.1
+        for node in names:
+            x, y = positions[node]
+            radius = radius_of(node)
+            if x - radius < left:
+                forces[node][0] += (left + radius - x) * 15.0
+            if x + radius > right:
+                forces[node][0] -= (x + radius - right) * 15.0
+            if y - radius < top:
+                forces[node][1] += (top + radius - y) * 15.0
+            if y + radius > bottom:
+                forces[node][1] -= (y + radius - bottom) * 15.0
+            if egg_x - radius <= x <= egg_x + egg_w + radius and egg_y - radius <= y <= egg_y + egg_h + radius:
+                forces[node][0] += (left - x) * 15.0 * 2.0
+        alpha = 1.0 - (iteration / iterations) * 0.05
+        for node in names:
+            velocities[node][0] = (velocities[node][0] + forces[node][0] * alpha) * 0.5
+            velocities[node][1] = (velocities[node][1] + forces[node][1] * alpha) * 0.5
+            x, y = positions[node]
+            new_x, new_y = x + velocities[node][0], y + velocities[node][1]
+            if node == anchor:
+                new_x, new_y = center
+                velocities[node] = [0.0, 0.0]
+            else:
+                radius = radius_of(node)
+                new_x = max(left + radius, min(right - radius, new_x))
+                new_y = max(top + radius, min(bottom - radius, new_y))
+            positions[node] = (new_x, new_y)
+
+
+def run_layout(graph, radii, iterations, numpy=True, **options):
+    names, positions, links, bounds, center, exclusion = graph
+    positions = dict(positions)
+    velocities = {name: [0.0, 0.0] for name in names}
+    has_numpy = force_layout.HAS_NUMPY
+    force_layout.HAS_NUMPY = has_numpy and numpy
+    try:
+        ForceLayout(**PARAMETERS, **options).simulate(names, positions, velocities, links, radii, bounds,
+                                                      iterations, anchor=names[0], center=center,
+                                                      exclusion=exclusion)
+    finally:
+        force_layout.HAS_NUMPY = has_numpy
+    return positions
+
+
+def run_legacy(graph, radius_of, iterations):
+    names, positions, links, bounds, center, exclusion = graph
+    positions = dict(positions)
+    velocities = {name: [0.0, 0.0] for name in names}
+    legacy_iterations(names, positions, velocities, links, radius_of, bounds, iterations, names[0], center, exclusion)
+    return positions
+
+
+def max_difference(a, b):
+    return max(math.hypot(a[name][0] - b[name][0], a[name][1] - b[name][1]) for name in a)
+
+
+def time_call(function, iterations):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1000.0 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", default="21,100,400,1500", help="comma-separated graph sizes")
+    parser.add_argument("--iterations", type=int, default=5, help="simulation iterations timed per size")
+    args = parser.parse_args()
+
+    pygame.init()
+    font = pygame.font.Font(None, 20)
+
+    graph = make_graph(21)
+    radii = {name: label_radius(font, name) for name in graph[0]}
+    legacy = run_legacy(graph, radii.__getitem__, 30)
+    checks = {
+        "numpy pairs": run_layout(graph, radii, 30, barnes_hut=False),
+        "python pairs": run_layout(graph, radii, 30, numpy=False, barnes_hut=False),
+        "barnes-hut theta=0": run_layout(graph, radii, 30, barnes_hut=True, theta=0.0),
+    }
+    for label, positions in checks.items():
+        difference = max_difference(legacy, positions)
+        assert difference < 1e-6, f"{label} drifted {difference:.3g} px from the legacy loop"
+    print(f"21-node map, 30 iterations: every implementation within 1e-6 px of the legacy loop "
+          f"(numpy: {force_layout.HAS_NUMPY})")
+
+    print(f"{'nodes':>6}{'legacy':>12}{'numpy':>12}{'python':>12}{'barnes-hut':>12}   ms / iteration")
+    for count in (int(value) for value in args.nodes.split(",")):
+        graph = make_graph(count)
+        radii = {name: label_radius(font, name) for name in graph[0]}
+        iterations = args.iterations
+        # The legacy loop measured every label again for every pair it tested
+        legacy = (time_call(lambda: run_legacy(graph, lambda name: label_radius(font, name), iterations), iterations)
+                  if count <= LEGACY_MAX_NODES else None)
+        numpy_ms = (time_call(lambda: run_layout(graph, radii, iterations, barnes_hut=False), iterations)
+                    if force_layout.HAS_NUMPY else None)
+        python_ms = (time_call(lambda: run_layout(graph, radii, iterations, numpy=False, barnes_hut=False),
+                               iterations) if count <= LEGACY_MAX_NODES else None)
+        tree_ms = time_call(lambda: run_layout(graph, radii, iterations, barnes_hut=True), iterations)
+        cells = [f"{value:12.2f}" if value is not None else f"{'-':>12}" for value in (legacy, numpy_ms, python_ms, tree_ms)]
+        print(f"{count:>6}" + "".join(cells))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Lore search benchmark: per-query lower() scans vs the pre-normalized LoreIndex.
+
+Loads the lore collections straight out of truth_engine_X10.py (the literal
+assignments are evaluated with ast, so the game itself is not started), then
+times a set of `#term` / `search term` queries done the legacy way (lower-case
+every world record, counsel quote and directive on each query) against
+LoreIndex.search() over the same three collections, and over every lore
+collection (adding the dossier, Grid Bleed event data and Omega Override
+texts).
+
+Usage:
+    python -m benchmarks.bench_lore_search [--repeat 200]
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import time
+
+from lore_index import LoreIndex
+
+ENGINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "truth_engine_X10.py")
+LORE_NAMES = ("WORLD_RECORDS_DATA", "NAVIGATOR_COUNSEL_QUOTES", "SYSTEM_DIRECTIVES",
+              "LIVING_WITNESS_DOSSIER", "GRID_BLEED_EVENT_DATA", "OMEGA_OVERRIDE_TEXTS")
+QUERIES = ["truth", "bccrss", "omega", "legal", "fraud", "wr.00077", "mirror", "zzqq", "e"]
+
+
+def load_lore(path=ENGINE_PATH):
+    """Evaluate the module-level lore literals of the engine source."""
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    lore = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            name = getattr(node.targets[0], "id", None)
+            if name in LORE_NAMES:
+                lore[name] = ast.literal_eval(node.value)
+    return lore
+
+
+def search_legacy(lore, term):
+    """The old loop of the `#` and `search` commands (matching only, no formatting)."""
+    hits = []
+    for wr in lore["WORLD_RECORDS_DATA"]:
+        if term.lower() in wr['title'].lower() or term.lower() in wr['detail'].lower():
+            hits.append(wr['id'])
+    for i, quote in enumerate(lore["NAVIGATOR_COUNSEL_QUOTES"]):
+        if term.lower() in quote.lower():
+            hits.append(i + 1)
+    for i, directive in enumerate(lore["SYSTEM_DIRECTIVES"]):
+        if term.lower() in directive.lower():
+            hits.append(i + 1)
+    return hits
+
+
+def build_index(lore, everything):
+    index = LoreIndex()
+    index.add_collection("world_record", lore["WORLD_RECORDS_DATA"], title_key="title", text_key="detail", id_key="id")
+    index.add_collection("quote", lore["NAVIGATOR_COUNSEL_QUOTES"])
+    index.add_collection("directive", lore["SYSTEM_DIRECTIVES"])
+    if everything:
+        index.add_nested("dossier", lore["LIVING_WITNESS_DOSSIER"])
+        index.add_nested("grid_bleed", lore["GRID_BLEED_EVENT_DATA"])
+        index.add_collection("omega", lore["OMEGA_OVERRIDE_TEXTS"])
+    return index
+
+
+def time_queries(repeat, search):
+    times = []
+    for _ in range(repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            search(query)
+            times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.mean(times), sorted(times)[int(len(times) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    lore = load_lore()
+    start = time.perf_counter()
+    index = build_index(lore, everything=True)
+    build_ms = (time.perf_counter() - start) * 1000.0
+    same_scope = build_index(lore, everything=False)
+
+    for query in QUERIES:
+        assert len(search_legacy(lore, query)) == len(same_scope.search(query)), query
+
+    legacy = time_queries(args.repeat, lambda query: search_legacy(lore, query))
+    indexed = time_queries(args.repeat, same_scope.search)
+    full = time_queries(args.repeat, index.search)
+    print(f"lore index: {index.stats()['entries']} entries, {index.stats()['characters']} chars, "
+          f"built in {build_ms:.1f} ms")
+    print(f"legacy scan  (WR+quotes+directives) {legacy[0]:8.3f} ms/query (p95 {legacy[1]:.3f})")
+    print(f"LoreIndex    (WR+quotes+directives) {indexed[0]:8.3f} ms/query (p95 {indexed[1]:.3f})   "
+          f"speedup x{legacy[0] / indexed[0]:.2f}")
+    print(f"LoreIndex    (all lore collections) {full[0]:8.3f} ms/query (p95 {full[1]:.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Particle engine benchmark: per-particle dicts vs struct-of-arrays update.
+
+Spawns celebration firework bursts until N particles are live, then times
+N frames of update + cull + draw-data extraction done the legacy way (one
+dict per particle, list.remove() for dead ones) against a ParticleSystem
+(whole-array update, boolean-mask cull, render_data()).
+
+Usage:
+    python -m benchmarks.bench_particles [--particles 5000] [--frames 120]
+"""
+
+import argparse
+import math
+import random
+import statistics
+import time
+
+from particle_engine import HAS_NUMPY, Emitter, ParticleSystem
+
+SCREEN_WIDTH = 1100
+SCREEN_HEIGHT = 700
+FRAME_DT = 1.0 / 30.0
+
+CELEBRATION_FIREWORK = Emitter(count=(35, 50), speed=(150, 400), size=(3, 7), life=(1500, 3000),
+                               max_life=3000, color_jitter=20, lift=100)
+PALETTE = [(0, 255, 100), (255, 255, 255), (255, 215, 0), (218, 165, 32), (0, 200, 80)]
+
+
+def spawn_legacy(fireworks):
+    """One burst shaped like the old spawn_*_firework() dicts."""
+    burst_x = random.randint(100, SCREEN_WIDTH - 100)
+    burst_y = random.randint(100, SCREEN_HEIGHT - 100)
+    base_color = random.choice(PALETTE)
+    particles = []
+    for _ in range(random.randint(35, 50)):
+        angle = random.uniform(0, 2 * math.pi)
+        speed = random.uniform(150, 400)
+        variation = random.randint(-20, 20)
+        particles.append({
+            'x': burst_x, 'y': burst_y,
+            'vx': math.cos(angle) * speed, 'vy': math.sin(angle) * speed - 100,
+            'color': tuple(max(0, min(255, c + variation)) for c in base_color),
+            'size': random.randint(3, 7),
+            'life': random.uniform(1500, 3000), 'max_life': 3000, 'alpha': 255,
+        })
+    fireworks.append({'particles': particles, 'life': 3000})
+    return len(particles)
+
+
+def step_legacy(fireworks, dt):
+    for firework in fireworks[:]:
+        firework['life'] -= dt * 1000
+        for particle in firework['particles'][:]:
+            particle['x'] += particle['vx'] * dt
+            particle['y'] += particle['vy'] * dt
+            particle['vy'] += 150 * dt
+            particle['life'] -= dt * 1000
+            particle['alpha'] = max(0, int(255 * (particle['life'] / particle['max_life'])))
+            if particle['life'] <= 0:
+                firework['particles'].remove(particle)
+        if firework['life'] <= 0 or len(firework['particles']) == 0:
+            fireworks.remove(firework)
+    return [(int(p['x']), int(p['y']), p['size'], tuple(c // 16 * 16 for c in p['color']), p['alpha'])
+            for firework in fireworks for p in firework['particles'] if p['alpha'] > 0]
+
+
+def step_engine(system, dt):
+    system.update(dt)
+    return system.render_data(16)
+
+
+def time_frames(frames, step, respawn):
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        step()
+        times.append((time.perf_counter() - start) * 1000.0)
+        respawn()
+    return statistics.mean(times), sorted(times)[int(len(times) * 0.95) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--particles", type=int, default=5000)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    random.seed(925)
+    fireworks = []
+    while sum(len(f['particles']) for f in fireworks) < args.particles:
+        spawn_legacy(fireworks)
+
+    system = ParticleSystem(gravity=150)
+    while len(system) < args.particles:
+        system.burst(CELEBRATION_FIREWORK, random.randint(100, SCREEN_WIDTH - 100),
+                     random.randint(100, SCREEN_HEIGHT - 100), random.choice(PALETTE))
+
+    # Keep the live count roughly constant by topping up what the cull removed
+    def respawn_legacy():
+        while sum(len(f['particles']) for f in fireworks) < args.particles:
+            spawn_legacy(fireworks)
+
+    def respawn_engine():
+        while len(system) < args.particles:
+            system.burst(CELEBRATION_FIREWORK, random.randint(100, SCREEN_WIDTH - 100),
+                         random.randint(100, SCREEN_HEIGHT - 100), random.choice(PALETTE))
+
+    legacy = time_frames(args.frames, lambda: step_legacy(fireworks, FRAME_DT), respawn_legacy)
+    engine = time_frames(args.frames, lambda: step_engine(system, FRAME_DT), respawn_engine)
+    backend = "numpy" if HAS_NUMPY else "python lists"
+    print(f"particles x{args.particles:<7} legacy {legacy[0]:8.3f} ms (p95 {legacy[1]:.3f})   "
+          f"engine[{backend}] {engine[0]:8.3f} ms (p95 {engine[1]:.3f})   speedup x{legacy[0] / engine[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
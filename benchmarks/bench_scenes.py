@@ -0,0 +1,190 @@
+"""
+Scene rendering benchmark: frame times and allocations of every scene, against a JSON baseline.
+
+Each scenario starts the real engine in a subprocess as a headless run
+(python truth_engine_X10.py --headless --fresh, see headless.py), puts it in
+one scene and renders --warmup + --frames frames offscreen. The headless
+report gives the mean / p95 frame time and the allocations per frame of the
+measured frames: surfaces created by the surface pool, fonts constructed by
+the font pool and the growth of the Python heap in allocated blocks.
+
+The scenarios cover the opening transmission, the dashboard idle and with
+the mirror cascade effects retriggered every EFFECT_INTERVAL frames, the
+four final verdict stages (each held for the whole run; a run that ends in
+another stage is an error), the essays screen, the history log, GridBleed.txt
+in the fullscreen context window and the node map with 0, 20 and all 41
+resonance nodes lit.
+
+--save writes the results as a JSON baseline; --compare reads one and flags
+every scene whose mean or p95 frame time grew by more than --threshold (and
+by at least MIN_DELTA_MS), or whose allocations per frame went up. The exit
+status is 1 when something regressed, so the comparison can gate CI.
+Baselines are only comparable on the machine that recorded them.
+
+Usage:
+    python -m benchmarks.bench_scenes [--frames 120] [--warmup 15] [--repeat 3] [--scenes dashboard,node_map_41]
+    python -m benchmarks.bench_scenes --save benchmarks/scenes_baseline.json
+    python -m benchmarks.bench_scenes --compare benchmarks/scenes_baseline.json [--threshold 0.10]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENGINE_PATH = os.path.join(ROOT, "truth_engine_X10.py")
+EFFECT_COMMAND = "trigger_mirror_cascade"  # Matrix rain, flash, pulse, glitch, shake and a particle burst
+EFFECT_INTERVAL = 30  # Frames between two effect triggers, so effects stay on screen during the run
+MIN_DELTA_MS = 0.5  # Frame time changes smaller than this are noise, whatever the ratio
+MIN_DELTA_BLOCKS = 10.0
+ALLOCATION_KEYS = ("surfaces", "fonts", "blocks")
+
+
+def scenarios(total_frames):
+    """{scenario name: engine arguments} for a run of total_frames frames."""
+    effects = ";".join([EFFECT_COMMAND] * (total_frames // EFFECT_INTERVAL + 1))
+    result = {
+        "initial_transmission": ["--scene", "initial_transmission"],
+        "dashboard": ["--scene", "dashboard"],
+        "dashboard_effects": ["--scene", "dashboard", "--commands", effects, "--interval", str(EFFECT_INTERVAL)],
+    }
+    for stage in range(4):
+        result[f"final_verdict_{stage}"] = ["--scene", "final_verdict", "--stage", str(stage)]
+    result["essays_command"] = ["--scene", "essays_command"]
+    result["history_log"] = ["--scene", "history_log"]
+    result["context_gridbleed"] = ["--scene", "dashboard", "--commands", "essay gridbleed"]
+    for count in (0, 20, 41):
+        result[f"node_map_{count}"] = ["--scene", "dashboard", "--node-map", "--resonance", str(count)]
+    return result
+
+
+def run_scenario(args, frames, warmup):
+    """Headless report of one engine run with args."""
+    handle, report_path = tempfile.mkstemp(suffix=".json", prefix="bench_scene_")
+    os.close(handle)
+    try:
+        command = [sys.executable, ENGINE_PATH, "--headless", "--fresh", "--frames", str(frames + warmup),
+                   "--warmup", str(warmup), "--report", report_path] + args
+        process = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        if process.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} exited with {process.returncode}:\n{process.stderr[-2000:]}")
+        with open(report_path, encoding="utf-8") as file:
+            report = json.load(file)
+    finally:
+        os.remove(report_path)
+    if "--stage" in args:
+        stage = int(args[args.index("--stage") + 1])
+        if report.get("final_stage") != stage:
+            raise RuntimeError(f"{' '.join(args)} ended in final verdict stage {report.get('final_stage')}")
+    return report
+
+
+def measure(args, frames, warmup, repeat):
+    """{"mean_ms", "p95_ms", "surfaces", "fonts", "blocks"}: medians over repeat runs."""
+    reports = [run_scenario(args, frames, warmup) for _ in range(repeat)]
+    result = {
+        "mean_ms": statistics.median(report["frame_ms"]["mean"] for report in reports),
+        "p95_ms": statistics.median(report["frame_ms"]["p95"] for report in reports),
+    }
+    for key in ALLOCATION_KEYS:
+        result[key] = statistics.median(report["allocations"][key] for report in reports)
+    return result
+
+
+def regressions(current, baseline, threshold):
+    """Reasons current is worse than baseline (empty if it is not)."""
+    reasons = []
+    for key in ("mean_ms", "p95_ms"):
+        growth = current[key] - baseline[key]
+        if growth > MIN_DELTA_MS and current[key] > baseline[key] * (1 + threshold):
+            reasons.append(f"{key} +{growth / baseline[key] * 100 if baseline[key] else 100:.0f}%")
+    for key in ("surfaces", "fonts"):
+        if current[key] > baseline[key] + 0.05:
+            reasons.append(f"{key} {baseline[key]:.2f} -> {current[key]:.2f}/frame")
+    growth = current["blocks"] - baseline["blocks"]
+    if growth > MIN_DELTA_BLOCKS and current["blocks"] > baseline["blocks"] * (1 + threshold):
+        reasons.append(f"heap blocks {baseline['blocks']:+.0f} -> {current['blocks']:+.0f}/frame")
+    return reasons
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_baseline(path, results, frames, warmup):
+    try:
+        from importlib.metadata import version
+        pygame_version = version("pygame")
+    except Exception:
+        pygame_version = None
+    baseline = {
+        "recorded": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pygame": pygame_version,
+        "frames": frames,
+        "warmup": warmup,
+        "scenes": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=120, help="measured frames per scene")
+    parser.add_argument("--warmup", type=int, default=15, help="frames rendered before measuring")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per scene (medians are kept)")
+    parser.add_argument("--scenes", help="comma-separated scenario names (default: all)")
+    parser.add_argument("--save", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", help="JSON baseline to flag regressions against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed frame time growth (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    available = scenarios(args.frames + args.warmup)
+    names = args.scenes.split(",") if args.scenes else list(available)
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        parser.error(f"unknown scenes {', '.join(unknown)} (choose from {', '.join(available)})")
+    baseline = load_baseline(args.compare)["scenes"] if args.compare else {}
+
+    print(f"{len(names)} scenes x {args.frames} frames (+{args.warmup} warmup), {args.repeat} run(s) each")
+    print(f"{'scene':<22}{'mean ms':>9}{'p95 ms':>9}{'surf/f':>8}{'font/f':>8}{'blocks/f':>10}"
+          + ("   vs baseline" if baseline else ""))
+    results = {}
+    regressed = []
+    for name in names:
+        result = results[name] = measure(available[name], args.frames, args.warmup, max(1, args.repeat))
+        line = (f"{name:<22}{result['mean_ms']:9.2f}{result['p95_ms']:9.2f}{result['surfaces']:8.2f}"
+                f"{result['fonts']:8.2f}{result['blocks']:+10.1f}")
+        if baseline:
+            base = baseline.get(name)
+            if base is None:
+                line += "   (not in baseline)"
+            else:
+                reasons = regressions(result, base, args.threshold)
+                change = (result["mean_ms"] - base["mean_ms"]) / base["mean_ms"] * 100 if base["mean_ms"] else 0.0
+                line += f"   {change:+6.1f}%  " + ("REGRESSION: " + ", ".join(reasons) if reasons else "ok")
+                if reasons:
+                    regressed.append(name)
+        print(line, flush=True)
+
+    if args.save:
+        save_baseline(args.save, results, args.frames, args.warmup)
+        print(f"baseline written to {args.save}")
+    if baseline:
+        print(f"{len(regressed)} regression(s)" + (f": {', '.join(regressed)}" if regressed else "")
+              + f" (threshold {args.threshold * 100:.0f}%)")
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Sprite batch benchmark: per-sprite blits vs batched submission.
+
+Simulates 1,000+ live celebration firework particles and a full dashboard
+matrix rain, then times N frames of each effect drawn the legacy way
+(per-particle Surface allocation + screen.blit / font.render per glyph)
+against the batched way (cached sprites / glyph atlas + one blits() call).
+
+Usage:
+    python -m benchmarks.bench_sprite_batch [--particles 1500] [--frames 120]
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # type: ignore
+
+from glyph_atlas import atlas_for
+from sprite_batch import SpriteBatch, SpriteCache
+
+SCREEN_WIDTH = 1100
+SCREEN_HEIGHT = 700
+
+
+def make_particles(count):
+    """Firework particle dicts shaped like the ones spawn_*_firework() creates."""
+    palette = [(0, 255, 100), (255, 255, 255), (255, 215, 0), (218, 165, 32), (0, 200, 80)]
+    particles = []
+    for _ in range(count):
+        base = random.choice(palette)
+        variation = random.randint(-20, 20)
+        angle = random.uniform(0, 2 * math.pi)
+        distance = random.uniform(0, 300)
+        particles.append({
+            'x': SCREEN_WIDTH / 2 + math.cos(angle) * distance,
+            'y': SCREEN_HEIGHT / 2 + math.sin(angle) * distance,
+            'color': tuple(max(0, min(255, c + variation)) for c in base),
+            'size': random.randint(3, 7),
+            'alpha': random.randint(1, 255),
+        })
+    return particles
+
+
+def draw_particles_legacy(screen, particles):
+    for particle in particles:
+        glow_size = particle['size'] + 4
+        glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+        glow_alpha = min(particle['alpha'] // 2, 128)
+        pygame.draw.circle(glow_surf, (*particle['color'], glow_alpha), (glow_size, glow_size), glow_size)
+        screen.blit(glow_surf, (int(particle['x'] - glow_size), int(particle['y'] - glow_size)))
+        pygame.draw.circle(screen, particle['color'], (int(particle['x']), int(particle['y'])), particle['size'])
+
+
+def build_sprite(color, size, glow_alpha):
+    glow_size = size + 4
+    sprite = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*color, glow_alpha), (glow_size, glow_size), glow_size)
+    pygame.draw.circle(sprite, (*color, 255), (glow_size, glow_size), size)
+    return sprite
+
+
+def draw_particles_batched(screen, particles, batch, cache):
+    for particle in particles:
+        size = particle['size']
+        glow_size = size + 4
+        color = tuple(c // 16 * 16 for c in particle['color'])
+        glow_alpha = min(particle['alpha'] // 2, 128) // 8 * 8
+        sprite = cache.get((color, size, glow_alpha), build_sprite)
+        batch.add("fireworks", sprite, (int(particle['x'] - glow_size), int(particle['y'] - glow_size)))
+    batch.flush(screen, "fireworks")
+
+
+def make_rain(font_size):
+    chars = "ΩΦ∑∆ΓΛΠΣΨ01*/|"
+    columns = SCREEN_WIDTH // (font_size - 3) + 1
+    return [(x * (font_size - 3), random.randint(0, SCREEN_HEIGHT),
+             [random.choice(chars) for _ in range(20)]) for x in range(columns)]
+
+
+def rain_color(i, length):
+    fade = (length - i) / length
+    return (0, int(50 + 150 * fade), 0)
+
+
+def draw_rain_legacy(screen, font, rain, font_size):
+    for x, y, chars in rain:
+        for i, char in enumerate(chars):
+            screen.blit(font.render(char, True, rain_color(i, len(chars))), (x, y - i * font_size))
+
+
+def draw_rain_batched(screen, font, rain, font_size, batch):
+    atlas = atlas_for(font)
+    for x, y, chars in rain:
+        for i, char in enumerate(chars):
+            cell = atlas.cell(char, rain_color(i, len(chars)))
+            if cell is not None:
+                batch.add("rain", cell, (x, y - i * font_size))
+    batch.flush(screen, "rain")
+
+
+def time_frames(frames, draw):
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return statistics.mean(times), sorted(times)[int(len(times) * 0.95) - 1]
+
+
+def report(label, legacy, batched):
+    print(f"{label:<28} legacy {legacy[0]:8.3f} ms (p95 {legacy[1]:.3f})   "
+          f"batched {batched[0]:8.3f} ms (p95 {batched[1]:.3f})   speedup x{legacy[0] / batched[0]:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--particles", type=int, default=1500)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    random.seed(925)
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    batch = SpriteBatch()
+    cache = SpriteCache()
+
+    particles = make_particles(args.particles)
+    draw_particles_batched(screen, particles, batch, cache)  # warm the sprite cache
+    report(f"fireworks x{args.particles}",
+           time_frames(args.frames, lambda: draw_particles_legacy(screen, particles)),
+           time_frames(args.frames, lambda: draw_particles_batched(screen, particles, batch, cache)))
+
+    font_size = 17
+    font = pygame.font.Font(None, font_size)
+    rain = make_rain(font_size)
+    draw_rain_batched(screen, font, rain, font_size, batch)  # warm the glyph atlas
+    report(f"matrix rain x{sum(len(c) for _, _, c in rain)}",
+           time_frames(args.frames, lambda: draw_rain_legacy(screen, font, rain, font_size)),
+           time_frames(args.frames, lambda: draw_rain_batched(screen, font, rain, font_size, batch)))
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
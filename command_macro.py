@@ -0,0 +1,200 @@
+"""
+Command Macro Module
+Replays a text file of terminal commands through the engine, timing each command.
+
+A macro is a plain text file with one terminal command per line, exactly as
+it would be typed into the dashboard terminal:
+
+    // opening sequence
+    essay 019
+    #bccrss
+    node_map
+    wait 30
+    sigil 1..13
+    execute wr_mega
+
+Blank lines and lines starting with // are skipped (# starts a lore search,
+so it cannot mark comments). `wait N` adds N frames before the next command.
+A line containing an integer range `a..b` expands to one command per number
+(`sigil 1..13` is sigil 1, sigil 2, ... sigil 13).
+
+A MacroPlayer hands the commands out one per call of next_command(), with
+`interval` frames between two commands. The engine runs each of them like
+Enter does (dispatch, universal tracking, command history), so a replay
+exercises the same pipeline as a person typing. An engine started with
+--macro goes straight to the dashboard, like a headless run, so the replay
+never runs during the opening transmission. In realtime mode the main
+loop keeps its FPS clock, so the spacing matches an interactive session.
+Otherwise the clock is not throttled and the commands go through as fast
+as frames can be drawn.
+
+end_frame() is given the FrameProfiler sections of every frame. Each command
+gets a timing record: the time spent in its handler, the frame it ran in, and
+the frames and milliseconds until the next command (the settle time of
+the context window, node map and effects it triggered). save_macro() writes a
+command history back out as a macro file, so a session can be recorded and
+replayed.
+"""
+
+import argparse
+import os
+import re
+
+from frame_profiler import percentile
+
+RANGE_RE = re.compile(r"(\d+)\.\.(\d+)")
+WAIT_RE = re.compile(r"wait\s+(\d+)$", re.IGNORECASE)
+
+
+class MacroStep:
+    """One command of a macro and the extra frames to wait before it."""
+
+    __slots__ = ("command", "wait")
+
+    def __init__(self, command, wait=0):
+        self.command = command
+        self.wait = wait
+
+    def __repr__(self):
+        return f"MacroStep({self.command!r}, wait={self.wait})"
+
+
+def parse_macro(text):
+    """MacroSteps of macro source text (comments, wait lines and a..b ranges handled)."""
+    steps = []
+    wait = 0
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        match = WAIT_RE.match(line)
+        if match:
+            wait += int(match.group(1))
+            continue
+        match = RANGE_RE.search(line)
+        if match:
+            first, last = int(match.group(1)), int(match.group(2))
+            step = 1 if last >= first else -1
+            commands = [line[:match.start()] + str(number) + line[match.end():]
+                        for number in range(first, last + step, step)]
+        else:
+            commands = [line]
+        for command in commands:
+            steps.append(MacroStep(command, wait))
+            wait = 0
+    return steps
+
+
+def load_macro(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return parse_macro(file.read())
+
+
+def save_macro(path, commands):
+    """Write commands (oldest first) as a macro file. Returns the number written."""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"// {len(commands)} commands\n")
+        for command in commands:
+            file.write(command + "\n")
+    return len(commands)
+
+
+class MacroPlayer:
+    """Hands out macro commands every `interval` frames and times each one."""
+
+    def __init__(self, steps, interval=1, realtime=False, delay=3, name="macro"):
+        self.steps = list(steps)
+        self.interval = max(1, interval)
+        self.realtime = realtime  # Keep the FPS clock; otherwise frames are not throttled
+        self.name = name
+        self.position = 0
+        self.timings = []  # One record per command run, in order
+        self.frames = 0
+        # Frames to let pass before the next command (the first ones let the engine settle)
+        self._countdown = delay + (self.steps[0].wait if self.steps else 0)
+        self._issued = False  # A command was handed out this frame
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        kwargs.setdefault("name", os.path.basename(path))
+        return cls(load_macro(path), **kwargs)
+
+    @classmethod
+    def from_argv(cls, argv):
+        """MacroPlayer for --macro on the engine's command line, or None."""
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument("--macro")
+        parser.add_argument("--macro-interval", type=int, default=1)
+        parser.add_argument("--realtime", action="store_true")
+        args, _ = parser.parse_known_args(argv)
+        if not args.macro:
+            return None
+        return cls.from_file(args.macro, interval=args.macro_interval, realtime=args.realtime)
+
+    def __len__(self):
+        return len(self.steps)
+
+    @property
+    def finished(self):
+        """Every command was run and the last one had its interval to settle."""
+        return self.position >= len(self.steps) and self._countdown <= 0
+
+    def next_command(self):
+        """Call once per frame: the command due this frame, or None."""
+        if self._countdown > 0:
+            self._countdown -= 1
+            return None
+        if self.position >= len(self.steps):
+            return None
+        step = self.steps[self.position]
+        self.position += 1
+        following = self.steps[self.position].wait if self.position < len(self.steps) else 0
+        self._countdown = self.interval - 1 + following
+        self._issued = True
+        self.timings.append({"command": step.command, "frame": self.frames, "command_ms": 0.0,
+                             "frame_ms": 0.0, "settle_frames": 0, "settle_ms": 0.0})
+        return step.command
+
+    def end_frame(self, sections):
+        """Account a finished frame (FrameProfiler sections in ms) to the last command run."""
+        if self.timings:
+            timing = self.timings[-1]
+            total = sections.get("total", 0.0)
+            if self._issued:
+                timing["command_ms"] = sections.get("command", 0.0)
+                timing["frame_ms"] = total
+            timing["settle_frames"] += 1
+            timing["settle_ms"] += total
+        self._issued = False
+        self.frames += 1
+
+    def summary(self):
+        """{"commands", "frames", "command_ms", "frame_ms", "settle_ms"} with mean / p95 / max of each timing."""
+        result = {"commands": len(self.timings), "frames": self.frames}
+        for key in ("command_ms", "frame_ms", "settle_ms"):
+            values = sorted(timing[key] for timing in self.timings)
+            result[key] = {
+                "mean": sum(values) / len(values) if values else 0.0,
+                "p95": percentile(values, 0.95),
+                "max": values[-1] if values else 0.0,
+            }
+        return result
+
+    def report_lines(self):
+        """Context window lines: the totals, then one row per command, slowest handlers first."""
+        summary = self.summary()
+        lines = [
+            f"╔═══ MACRO REPLAY: {self.name} ({'realtime' if self.realtime else 'max speed'}) ═══╗",
+            f"  {summary['commands']} commands in {summary['frames']} frames",
+            f"  handler ms  mean {summary['command_ms']['mean']:.2f}  p95 {summary['command_ms']['p95']:.2f}"
+            f"  max {summary['command_ms']['max']:.2f}",
+            f"  frame ms    mean {summary['frame_ms']['mean']:.2f}  p95 {summary['frame_ms']['p95']:.2f}"
+            f"  max {summary['frame_ms']['max']:.2f}",
+            "",
+            f"  {'command':<28}{'handler':>9}{'frame':>9}{'settle':>10}",
+        ]
+        for timing in sorted(self.timings, key=lambda timing: -timing["command_ms"]):
+            lines.append(f"  {timing['command'][:27]:<28}{timing['command_ms']:9.2f}{timing['frame_ms']:9.2f}"
+                         f"{timing['settle_ms']:10.2f}  ({timing['settle_frames']} frames)")
+        lines.append("╚" + "═" * 50 + "╝")
+        return lines
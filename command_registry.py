@@ -0,0 +1,144 @@
+"""
+Command Registry Module
+Table-driven dispatch of terminal commands: exact names by dict, prefixes by trie.
+
+Every command typed into the dashboard terminal used to walk one long
+if/elif chain in the main loop, comparing the input against each command
+(and each alias) in turn until a branch matched, so the last commands of
+the chain paid for ~50 failed comparisons and the handlers could not be
+listed, tested or timed on their own.
+
+A CommandRegistry maps every exact name (aliases included) to its Command
+in a dict, and keeps the prefix commands ("essay ", "sigil", "search ",
+"#", ...) in a character trie. resolve() tries the dict first and then
+walks the trie along the input, remembering the longest registered prefix
+it passes, so a lookup costs one hash plus one step per character of the
+prefix, however many commands there are.
+
+A Command carries its handler and the metadata the engine attaches to it:
+the node map resonance nodes it activates.
+"""
+
+
+class Command:
+    """One registered command: names (or prefix), handler and node-map metadata."""
+
+    __slots__ = ("names", "handler", "prefix", "resonance", "calls")
+
+    def __init__(self, names, handler, prefix=False, resonance=()):
+        self.names = tuple(names)
+        self.handler = handler
+        self.prefix = prefix        # Names are prefixes of the input rather than whole inputs
+        self.resonance = tuple(resonance)  # Node map nodes the command activates
+        self.calls = 0
+
+    @property
+    def name(self):
+        return self.names[0]
+
+    def __repr__(self):
+        kind = "prefix" if self.prefix else "command"
+        return f"Command({kind} {self.name!r} → {getattr(self.handler, '__name__', self.handler)})"
+
+
+class CommandRegistry:
+    """Exact-name dict plus prefix trie of Commands, with an optional fallback for unknown input."""
+
+    def __init__(self):
+        self._exact = {}
+        self._trie = [{}, None]  # children, command registered for the prefix ending here
+        self._commands = []
+        self.fallback = None
+        self.dispatches = 0
+        self.unknown = 0
+
+    def register(self, names, handler, prefix=False, resonance=()):
+        """Register handler under one name or a list of aliases. Returns the Command."""
+        if isinstance(names, str):
+            names = [names]
+        command = Command(names, handler, prefix, resonance)
+        for name in command.names:
+            if prefix:
+                node = self._trie
+                for char in name:
+                    node = node[0].setdefault(char, [{}, None])
+                if node[1] is not None:
+                    raise ValueError(f"prefix {name!r} is already registered")
+                node[1] = command
+            else:
+                if name in self._exact:
+                    raise ValueError(f"command {name!r} is already registered")
+                self._exact[name] = command
+        self._commands.append(command)
+        return command
+
+    def register_table(self, table, prefix=False, resonance_for=None):
+        """
+        Register every (names, handler) row of table. resonance_for(command), if
+        given, supplies the resonance nodes of each registered command.
+        """
+        for names, handler in table:
+            command = self.register(names, handler, prefix=prefix)
+            if resonance_for is not None:
+                command.resonance = tuple(resonance_for(command))
+
+    def __len__(self):
+        return len(self._commands)
+
+    def __iter__(self):
+        return iter(self._commands)
+
+    def names(self):
+        """Every exact name and prefix, in registration order."""
+        return [name for command in self._commands for name in command.names]
+
+    def resolve(self, text):
+        """
+        Command for text: an exact name, else the longest registered prefix of
+        text. Returns (command, matched name), or (None, None).
+        """
+        command = self._exact.get(text)
+        if command is not None:
+            return command, text
+        node = self._trie
+        best, length = None, 0
+        for i, char in enumerate(text):
+            node = node[0].get(char)
+            if node is None:
+                break
+            if node[1] is not None:
+                best, length = node[1], i + 1
+        if best is None:
+            return None, None
+        return best, text[:length]
+
+    def dispatch(self, text, *args):
+        """
+        Run the handler registered for text with *args (the fallback for unknown
+        text). Returns the Command that ran, or None if nothing did.
+        """
+        self.dispatches += 1
+        command, _ = self.resolve(text)
+        if command is None:
+            self.unknown += 1
+            command = self.fallback
+            if command is None:
+                return None
+        command.calls += 1
+        command.handler(*args)
+        return command
+
+    def set_fallback(self, handler):
+        """Handler for input no command matches."""
+        self.fallback = Command(["<unknown>"], handler)
+        return self.fallback
+
+    def stats(self):
+        """Return a dictionary snapshot of the registry."""
+        return {
+            "commands": len(self._commands),
+            "names": len(self._exact),
+            "prefixes": sum(len(command.names) for command in self._commands if command.prefix),
+            "dispatches": self.dispatches,
+            "unknown": self.unknown,
+        }
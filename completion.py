@@ -0,0 +1,224 @@
+"""
+Completion Module
+Prefix trie of commands, term dictionary and budgeted live completions.
+
+The hint line under the command box rebuilt a literal list of ~200 command
+strings every frame and scanned it with startswith(). A PrefixTrie is built
+once; every node remembers how many commands pass through it and the first
+few of them, so a lookup costs one step per typed character no matter how
+many commands exist.
+
+A TermDictionary holds the sorted vocabulary of the essay index and the lore
+collections, so the word being typed after `search_essays`, `search` or `#`
+can be completed with a bisect.
+
+LiveCompleter ties both to the command box: on every frame it is given the
+current input text and works through its stages (command completions, term
+completions, top essay hits) until the per-frame budget is spent. Whatever
+is left carries over to the next frame, and results are cached per input, so
+typing never adds more than the budget to a frame. The essay search is the
+only stage that cannot be split, and its cost varies with the query (a word
+as common as "the" decodes tens of thousands of postings values on a cold
+index), so each query's cost is estimated first (search_cost): the search is
+started only if the estimate fits in what is left of the budget, and a query
+estimated above the whole budget gets no live preview. Results are memoized
+per query.
+"""
+
+import time
+from bisect import bisect_left
+
+
+class PrefixTrie:
+    """Character trie of words that remembers, per node, the word count and the first `keep` words."""
+
+    def __init__(self, words=(), keep=8):
+        self.keep = keep
+        self._root = [{}, [], 0]  # children, first words (insertion order), word count
+        self._words = set()
+        for word in words:
+            self.insert(word)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word):
+        return word in self._words
+
+    def insert(self, word):
+        """Add word (duplicates are ignored)."""
+        if word in self._words:
+            return
+        self._words.add(word)
+        node = self._root
+        self._count(node, word)
+        for char in word:
+            node = node[0].setdefault(char, [{}, [], 0])
+            self._count(node, word)
+
+    def _count(self, node, word):
+        node[2] += 1
+        if len(node[1]) < self.keep:
+            node[1].append(word)
+
+    def complete(self, prefix, limit=3):
+        """Return (first `limit` words starting with prefix, total number of such words)."""
+        node = self._root
+        for char in prefix:
+            node = node[0].get(char)
+            if node is None:
+                return [], 0
+        return node[1][:limit], node[2]
+
+
+class TermDictionary:
+    """Sorted vocabulary with prefix completion (shortest completions first)."""
+
+    SCAN = 64  # Candidates looked at per lookup before ranking
+
+    def __init__(self, terms=()):
+        self.terms = sorted(set(terms))
+
+    def __len__(self):
+        return len(self.terms)
+
+    def complete(self, prefix, limit=3):
+        terms = self.terms
+        i = bisect_left(terms, prefix)
+        candidates = []
+        while i < len(terms) and len(candidates) < self.SCAN and terms[i].startswith(prefix):
+            candidates.append(terms[i])
+            i += 1
+        candidates.sort(key=lambda term: (len(term), term))
+        return candidates[:limit]
+
+
+class LiveCompleter:
+    """
+    Live completions for the command box under a per-frame time budget.
+
+    search(query, limit) returns display labels of the top hits for a query;
+    it is used for inputs starting with one of search_prefixes. Term
+    completions are offered after any of term_prefixes (which include the
+    search prefixes). search_cost(query) estimates the milliseconds a search
+    takes; without it every query is assumed to take search_cost_ms.
+    """
+
+    STAGES = ("commands", "terms", "hits")
+    MIN_QUERY = 2  # Characters a query needs before the search stage runs
+    CACHE_SIZE = 64
+
+    def __init__(self, commands, terms, search=None, search_prefixes=(), term_prefixes=(),
+                 budget_ms=2.0, search_cost=None, search_cost_ms=1.0, limit=3):
+        self.commands = commands
+        self.terms = terms
+        self.search = search
+        self.search_prefixes = tuple(search_prefixes)
+        self.term_prefixes = tuple(search_prefixes) + tuple(term_prefixes)
+        self.budget_ms = budget_ms
+        self.search_cost = search_cost
+        self.search_cost_ms = search_cost_ms  # Estimate used without search_cost
+        self.limit = limit
+        self.text = None
+        self.command_hints = []
+        self.command_count = 0
+        self.term_hints = []
+        self.hits = []
+        self.deferred = 0  # Frames on which work was carried over to the next frame
+        self.skipped = 0  # Queries estimated too costly for a live search
+        self._estimate = None  # Estimated cost (ms) of searching the current query
+        self._stage = len(self.STAGES)
+        self._cache = {}
+
+    @property
+    def done(self):
+        return self._stage >= len(self.STAGES)
+
+    def update(self, text):
+        """Advance the completions of text within the frame budget. Returns True while work remains."""
+        if text != self.text:
+            self.text = text
+            self.command_hints, self.command_count = [], 0
+            self.term_hints = []
+            self.hits = []
+            self._estimate = None
+            self._stage = 0 if text else len(self.STAGES)
+        if self.done:
+            return False
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        while not self.done:
+            stage = self.STAGES[self._stage]
+            if stage == "hits":
+                estimate = self._search_estimate()
+                if estimate > self.budget_ms:
+                    self.skipped += 1  # Would overrun any frame: no live preview for this query
+                    self._stage += 1
+                    continue
+                if estimate > (deadline - time.perf_counter()) * 1000.0:
+                    break
+            getattr(self, "_run_" + stage)()
+            self._stage += 1
+            if time.perf_counter() >= deadline:
+                break
+        if not self.done:
+            self.deferred += 1
+        return not self.done
+
+    def _split(self, prefixes):
+        """(prefix, rest) if the lower-cased input starts with one of prefixes, else (None, None)."""
+        lowered = self.text.lower()
+        for prefix in prefixes:
+            if lowered.startswith(prefix):
+                return prefix, self.text[len(prefix):]
+        return None, None
+
+    def _query(self):
+        prefix, rest = self._split(self.search_prefixes)
+        if prefix is None or len(rest.strip()) < self.MIN_QUERY:
+            return None
+        return rest.strip().lower()
+
+    def _search_estimate(self):
+        """Estimated cost (ms) of the hit search still to run for the current input; 0 if there is none."""
+        if self._estimate is None:
+            query = self._query()
+            if query is None or self.search is None or query in self._cache:
+                self._estimate = 0.0
+            elif self.search_cost is not None:
+                self._estimate = self.search_cost(query)
+            else:
+                self._estimate = self.search_cost_ms
+        return self._estimate
+
+    def _run_commands(self):
+        self.command_hints, self.command_count = self.commands.complete(self.text.lower(), self.limit)
+
+    def _run_terms(self):
+        prefix, rest = self._split(self.term_prefixes)
+        if prefix is None or not rest or rest[-1].isspace():
+            return
+        word = rest.split()[-1].lower()
+        self.term_hints = [term for term in self.terms.complete(word, self.limit + 1) if term != word][:self.limit]
+
+    def _run_hits(self):
+        query = self._query()
+        if query is None or self.search is None:
+            return
+        hits = self._cache.get(query)
+        if hits is None:
+            hits = self.search(query, self.limit)
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[query] = hits
+        self.hits = hits
+
+    def stats(self):
+        """Return a dictionary snapshot of the completer."""
+        return {
+            "commands": len(self.commands),
+            "terms": len(self.terms),
+            "cached_queries": len(self._cache),
+            "deferred_frames": self.deferred,
+            "skipped_searches": self.skipped,
+            "budget_ms": self.budget_ms,
+        }
@@ -0,0 +1,122 @@
+"""
+Dirty Regions Module
+Tracks which parts of the dashboard changed and presents only those rects.
+
+The main loop used to finish every frame with pygame.display.flip(), which
+pushes the whole back buffer to the window even when most dashboard panels
+show the same thing as the previous frame. Each panel now declares its
+region to a DirtyRegionTracker, either unconditionally (animated panels,
+rain streams, scan line) or through a state signature that only marks the
+region when the signature differs from the previous frame. present() then
+calls pygame.display.update(rects) with the changed rects only.
+
+The back buffer is still fully redrawn every frame, so a partial present is
+valid as long as every pixel that changed lies inside a marked rect. Frames
+that are not plain dashboard frames (other scenes, overlays, fullscreen
+context window) and the frame right after one are always presented with a
+full flip.
+"""
+
+import pygame  # type: ignore
+
+
+class DirtyRegionTracker:
+    """Per-frame dirty rect collection with state-signature panels and a debug overlay."""
+
+    DEBUG_PARTIAL_COLOR = (255, 0, 255)
+    DEBUG_FULL_COLOR = (255, 60, 60)
+
+    def __init__(self, screen_rect, full_threshold=0.85):
+        self.screen_rect = pygame.Rect(screen_rect)
+        # Above this fraction of the screen area a full flip is cheaper than many rects
+        self.full_threshold = full_threshold
+        self.debug_overlay = False
+        self._rects = []
+        self._states = {}
+        self._plain = False
+        self._previous_plain = False
+        self._outlined = []
+        self.frames = 0
+        self.partial_frames = 0
+        self.full_frames = 0
+        self.last_rect_count = 0
+        self.last_coverage = 1.0
+
+    def begin_frame(self, plain=True):
+        """Start collecting a frame. plain=False (overlays on screen) forces a full flip."""
+        self._rects.clear()
+        self._plain = plain
+        # Outlines drawn last frame are still on the window; repaint them
+        self._rects.extend(self._outlined)
+
+    def mark(self, rect):
+        """Declare a region as changed this frame."""
+        rect = self.screen_rect.clip(rect)
+        if rect.width > 0 and rect.height > 0:
+            self._rects.append(rect)
+
+    def panel(self, name, rect, *state):
+        """
+        Declare a panel with the state its pixels depend on.
+
+        The rect is marked when the state differs from the previous frame's
+        (or the panel is new). Returns True if the panel was marked.
+        """
+        changed = self._states.get(name) != state
+        self._states[name] = state
+        if changed:
+            self.mark(rect)
+        return changed
+
+    def invalidate(self):
+        """Force the current frame to be presented with a full flip."""
+        self._plain = False
+
+    def toggle_debug_overlay(self):
+        self.debug_overlay = not self.debug_overlay
+        self.invalidate()
+        return self.debug_overlay
+
+    def present(self, surface):
+        """Push the frame to the window (display.update(rects) or display.flip()). Returns the rect count."""
+        self.frames += 1
+        partial = self._plain and self._previous_plain
+        coverage = 1.0
+        if partial:
+            screen_area = self.screen_rect.width * self.screen_rect.height
+            coverage = sum(r.width * r.height for r in self._rects) / screen_area
+            partial = coverage < self.full_threshold
+        # Overlay pixels left by a non-plain frame are not covered by any mark
+        self._previous_plain = self._plain
+        self._plain = False
+        self._outlined = []
+        if partial:
+            if self.debug_overlay:
+                for rect in self._rects:
+                    pygame.draw.rect(surface, self.DEBUG_PARTIAL_COLOR, rect, 1)
+                self._outlined = list(self._rects)
+            pygame.display.update(self._rects)
+            self.partial_frames += 1
+            self.last_rect_count = len(self._rects)
+        else:
+            if self.debug_overlay:
+                pygame.draw.rect(surface, self.DEBUG_FULL_COLOR, self.screen_rect, 2)
+                r = self.screen_rect
+                self._outlined = [pygame.Rect(r.x, r.y, r.width, 2), pygame.Rect(r.x, r.bottom - 2, r.width, 2),
+                                  pygame.Rect(r.x, r.y, 2, r.height), pygame.Rect(r.right - 2, r.y, 2, r.height)]
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_rect_count = 1
+        self.last_coverage = min(1.0, coverage)
+        return self.last_rect_count
+
+    def stats(self):
+        """Return a dictionary snapshot of the tracker counters."""
+        return {
+            "frames": self.frames,
+            "partial_frames": self.partial_frames,
+            "full_frames": self.full_frames,
+            "last_rect_count": self.last_rect_count,
+            "last_coverage": self.last_coverage,
+            "debug_overlay": self.debug_overlay,
+        }
@@ -0,0 +1,189 @@
+"""
+Essay Store Module
+On-demand essay bodies from a packed file, with only metadata kept resident.
+
+`from essay_data import ESSAY_DATABASE` loaded the whole 1.7 MB essay module
+at startup and kept every essay body in memory for the session, although a
+session usually reads a handful of essays. An EssayStore keeps only the
+metadata (title, author, date, tags) of each essay; the bodies live in a
+packed UTF-8 file (essay_pack.bin) and an offset table (essay_pack.json)
+says where each one starts. Reading an essay seeks to its offset, decodes
+just that slice and keeps it in a small LRU of recently read essays.
+
+The pack is written from essay_data.py the first time it is needed and
+rewritten whenever essay_data.py changes (its size and mtime are recorded in
+the offset table); after that essay_data is never imported. If the pack
+cannot be written (read-only install), the store falls back to serving the
+imported dictionary directly.
+
+EssayStore is a read-only Mapping, so `essay_id in store`, `store[essay_id]`,
+`.keys()`, `.items()` and `len(store)` behave like the old dictionary.
+Callers that only need a title should use metadata(), which never touches
+the pack. Reads are serialized with a lock, so the search worker thread can
+load bodies while the main loop opens an essay.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+# Same directory as this module, like SaveManager.SAVE_FILE
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ESSAY_SOURCE = os.path.join(_SCRIPT_DIR, "essay_data.py")
+PACK_FILE = os.path.join(_SCRIPT_DIR, "essay_pack.bin")
+PACK_INDEX_FILE = os.path.join(_SCRIPT_DIR, "essay_pack.json")
+PACK_VERSION = 1
+
+
+def _source_signature(path):
+    """(size, mtime_ns) of the essay source, or None if it is not on disk (frozen builds)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def write_pack(essay_database, pack_path=PACK_FILE, index_path=PACK_INDEX_FILE, source_path=ESSAY_SOURCE):
+    """
+    Write every essay body of essay_database to pack_path and the metadata plus
+    (offset, length) of each body to index_path. Returns the metadata table.
+    """
+    essays = {}
+    offset = 0
+    with open(pack_path + ".tmp", "wb") as pack:
+        for essay_id, essay in essay_database.items():
+            body = essay.get("content", "").encode("utf-8")
+            pack.write(body)
+            meta = {key: value for key, value in essay.items() if key != "content"}
+            meta["offset"] = offset
+            meta["length"] = len(body)
+            essays[essay_id] = meta
+            offset += len(body)
+    table = {"version": PACK_VERSION, "source": _source_signature(source_path), "essays": essays}
+    with open(index_path + ".tmp", "w", encoding="utf-8") as file:
+        json.dump(table, file, ensure_ascii=False)
+    # Index last, so a half-written pack is never paired with a valid index
+    os.replace(pack_path + ".tmp", pack_path)
+    os.replace(index_path + ".tmp", index_path)
+    return essays
+
+
+def read_pack_index(index_path=PACK_INDEX_FILE, pack_path=PACK_FILE, source_path=ESSAY_SOURCE):
+    """Metadata table of an existing pack, or None if it is missing, stale or unreadable."""
+    try:
+        with open(index_path, "r", encoding="utf-8") as file:
+            table = json.load(file)
+        pack_size = os.path.getsize(pack_path)
+    except (OSError, ValueError):
+        return None
+    if table.get("version") != PACK_VERSION:
+        return None
+    source = _source_signature(source_path)
+    if source is not None and table.get("source") != source:
+        return None  # essay_data.py was edited since the pack was written
+    essays = table.get("essays", {})
+    if sum(meta["length"] for meta in essays.values()) != pack_size:
+        return None
+    return essays
+
+
+class EssayStore(Mapping):
+    """Read-only essay_id → essay dict mapping with lazily loaded, LRU-cached bodies."""
+
+    def __init__(self, metadata, pack_path=PACK_FILE, cache_size=8, bodies=None):
+        self._metadata = metadata
+        self._pack_path = pack_path
+        self._bodies = bodies  # Fallback: the imported ESSAY_DATABASE when there is no pack
+        self._pack = None
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()  # Guards the shared pack handle and the LRU
+        self.hits = 0
+        self.loads = 0
+
+    @classmethod
+    def open(cls, cache_size=8):
+        """Store over the packed essays, (re)writing the pack from essay_data.py if needed."""
+        metadata = read_pack_index()
+        if metadata is not None:
+            return cls(metadata, cache_size=cache_size)
+        from essay_data import ESSAY_DATABASE
+        try:
+            metadata = write_pack(ESSAY_DATABASE)
+        except OSError as e:
+            print(f"Essay pack not written ({e}); keeping essays in memory")
+            metadata = {essay_id: {key: value for key, value in essay.items() if key != "content"}
+                        for essay_id, essay in ESSAY_DATABASE.items()}
+            return cls(metadata, cache_size=cache_size, bodies=ESSAY_DATABASE)
+        return cls(metadata, cache_size=cache_size)
+
+    def __len__(self):
+        return len(self._metadata)
+
+    def __iter__(self):
+        return iter(self._metadata)
+
+    def __contains__(self, essay_id):
+        return essay_id in self._metadata
+
+    def metadata(self, essay_id):
+        """Title, author, date and tags of an essay (no body); raises KeyError if unknown."""
+        meta = self._metadata[essay_id]
+        return {key: value for key, value in meta.items() if key not in ("offset", "length")}
+
+    def __getitem__(self, essay_id):
+        with self._lock:
+            essay = self._cache.get(essay_id)
+            if essay is not None:
+                self._cache.move_to_end(essay_id)
+                self.hits += 1
+                return essay
+        essay = self.metadata(essay_id)
+        essay["content"] = self._read_body(essay_id)
+        with self._lock:
+            self.loads += 1
+            self._cache[essay_id] = essay
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return essay
+
+    def _read_body(self, essay_id):
+        if self._bodies is not None:
+            return self._bodies[essay_id].get("content", "")
+        meta = self._metadata[essay_id]
+        with self._lock:
+            if self._pack is None:
+                self._pack = open(self._pack_path, "rb")
+            self._pack.seek(meta["offset"])
+            data = self._pack.read(meta["length"])
+        return data.decode("utf-8")
+
+    def items(self):
+        """
+        Yield (essay_id, essay) for every essay in pack order. Full scans (index
+        builds) read bodies straight from the pack and bypass the LRU.
+        """
+        for essay_id in self._metadata:
+            essay = self.metadata(essay_id)
+            essay["content"] = self._read_body(essay_id)
+            yield essay_id, essay
+
+    def close(self):
+        with self._lock:
+            if self._pack is not None:
+                self._pack.close()
+                self._pack = None
+
+    def stats(self):
+        """Return a dictionary snapshot of the cache counters."""
+        return {
+            "essays": len(self._metadata),
+            "cached": len(self._cache),
+            "cache_size": self.cache_size,
+            "hits": self.hits,
+            "loads": self.loads,
+            "packed": self._bodies is None,
+        }
@@ -0,0 +1,110 @@
+"""
+Font Pool Module
+Process-wide cache of pygame Font objects shared by every scene.
+
+Fonts used to be constructed inside draw paths (pygame.font.SysFont and
+pygame.font.Font(pygame.font.match_font(...)) at 30 FPS). The pool resolves
+each (name, size, bold, italic) combination once and serves the cached object
+on every later request. The pool is bounded: when it is full the least
+recently used font is evicted.
+
+Hit/miss counters are kept so that steady-state frames can be verified to
+perform zero font constructions (see FontPool.end_frame / FontPool.stats).
+"""
+
+from collections import OrderedDict
+
+import pygame  # type: ignore
+
+
+class FontPool:
+    """Bounded LRU cache of pygame fonts keyed by (name, size, bold, italic)."""
+
+    DEFAULT_CAPACITY = 256
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, fallback_name="Arial"):
+        self.capacity = capacity
+        self.fallback_name = fallback_name
+        self._fonts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Constructions performed since the last end_frame() call
+        self.frame_misses = 0
+        self.last_frame_misses = 0
+
+    def get(self, name, size, bold=False, italic=False):
+        """
+        Return a system font (pygame.font.SysFont semantics).
+
+        Falls back to fallback_name, then to the pygame default font, if the
+        requested font cannot be loaded.
+        """
+        key = ("sys", name, size, bold, italic)
+        font = self._lookup(key)
+        if font is None:
+            try:
+                font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            except pygame.error:
+                try:
+                    font = pygame.font.SysFont(self.fallback_name, size, bold=bold, italic=italic)
+                except pygame.error:
+                    font = pygame.font.Font(None, max(10, size))
+            self._store(key, font)
+        return font
+
+    def match(self, name, size, bold=False, italic=False):
+        """
+        Return a font loaded from the file found by pygame.font.match_font.
+
+        Equivalent to pygame.font.Font(pygame.font.match_font(name, bold, italic), size).
+        name=None (or an unmatched name) gives the pygame default font.
+        """
+        key = ("file", name, size, bold, italic)
+        font = self._lookup(key)
+        if font is None:
+            path = pygame.font.match_font(name, bold=bold, italic=italic) if name else None
+            try:
+                font = pygame.font.Font(path, size)
+            except (pygame.error, OSError):
+                font = pygame.font.Font(None, size)
+            self._store(key, font)
+        return font
+
+    def end_frame(self):
+        """Close the current frame's accounting. Returns constructions made this frame."""
+        self.last_frame_misses = self.frame_misses
+        self.frame_misses = 0
+        return self.last_frame_misses
+
+    def stats(self):
+        """Return a dictionary snapshot of the pool counters."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._fonts),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "last_frame_misses": self.last_frame_misses,
+        }
+
+    def clear(self):
+        """Drop every cached font (counters are kept)."""
+        self._fonts.clear()
+
+    def _lookup(self, key):
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.hits += 1
+        return font
+
+    def _store(self, key, font):
+        self.misses += 1
+        self.frame_misses += 1
+        self._fonts[key] = font
+        if len(self._fonts) > self.capacity:
+            self._fonts.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,362 @@
+"""
+Force Layout Module
+Force-directed graph layout over position / velocity arrays, with a Barnes–Hut option.
+
+The node map used to lay out its graph with nested Python loops over every
+pair of node names: charge, link, collision and boundary forces were summed
+into a dict of [fx, fy] lists, and the collision radius of a node (which
+renders its label to measure it) was recomputed for every pair on every
+iteration. To keep frames bearable the simulation was cut to one iteration
+above 40 connections (without collisions) and skipped entirely above 60.
+
+A ForceLayout keeps the same forces and integration (d3-force style:
+charge, link, collision, center, boundaries, velocity decay, cooling) but
+works on an N x 2 position matrix and an N x 2 velocity matrix. Charge and
+collision forces are computed for all pairs at once from the N x N
+difference matrix, link forces are scattered with np.add.at, and
+boundaries, clamping and integration are whole-array operations. Collision
+radii are taken once per call instead of once per pair.
+
+For large graphs the all-pairs matrices are replaced by a QuadTree
+(barnes_hut=True, or automatically from BARNES_HUT_MIN_NODES nodes): charge
+from a far-away cell is approximated by its node count at its centre of
+mass when cell size / distance < theta, and collisions are only tested
+against nodes of cells within reach, so an iteration costs O(n log n)
+instead of O(n²).
+
+NumPy is used when available; without it the same forces are summed in
+plain Python loops over lists, so behaviour is identical, just slower.
+"""
+
+import math
+
+try:
+    import numpy as np  # type: ignore
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Node count from which barnes_hut=None switches to the quadtree. With NumPy the
+# all-pairs arrays still match it at 1500 nodes and only lose clearly from 2000
+# (bench_force_layout); the pure-Python loops lose from about 100
+BARNES_HUT_MIN_NODES = 2000 if HAS_NUMPY else 100
+MIN_DIST_SQ = 0.01  # Charge / link distances are clamped here to avoid dividing by zero
+
+
+class QuadTree:
+    """
+    Barnes–Hut quadtree of 2-D points. Every cell keeps its point count and
+    centre of mass; leaves hold up to leaf_size point indices.
+    """
+
+    MAX_DEPTH = 24
+
+    def __init__(self, xs, ys, leaf_size=4):
+        self.xs = xs
+        self.ys = ys
+        self.leaf_size = max(1, leaf_size)
+        self.cells = 0
+        if xs:
+            min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+            half = max(max_x - min_x, max_y - min_y) / 2.0 + 1e-6
+            self.root = self._build(list(range(len(xs))), (min_x + max_x) / 2.0, (min_y + max_y) / 2.0, half, 0)
+        else:
+            self.root = None
+
+    def _build(self, indices, cx, cy, half, depth):
+        """Cell [cx, cy, half, count, mass_x, mass_y, children, indices] over indices."""
+        xs, ys = self.xs, self.ys
+        count = len(indices)
+        mass_x = sum(xs[i] for i in indices) / count
+        mass_y = sum(ys[i] for i in indices) / count
+        self.cells += 1
+        if count <= self.leaf_size or depth >= self.MAX_DEPTH:
+            return [cx, cy, half, count, mass_x, mass_y, None, indices]
+        quadrants = ([], [], [], [])
+        for i in indices:
+            quadrants[(xs[i] >= cx) + 2 * (ys[i] >= cy)].append(i)
+        quarter = half / 2.0
+        children = [self._build(quadrant, cx + (quarter if q & 1 else -quarter),
+                                cy + (quarter if q & 2 else -quarter), quarter, depth + 1)
+                    for q, quadrant in enumerate(quadrants) if quadrant]
+        return [cx, cy, half, count, mass_x, mass_y, children, None]
+
+    def charge(self, i, strength, theta):
+        """Charge force (strength * d / |d|³ summed over the other points) on point i."""
+        x, y = self.xs[i], self.ys[i]
+        xs, ys = self.xs, self.ys
+        theta_sq = theta * theta
+        fx = fy = 0.0
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            cx, cy, half, count, mass_x, mass_y, children, indices = stack.pop()
+            if children is None:
+                for j in indices:
+                    if j == i:
+                        continue
+                    dx, dy = x - xs[j], y - ys[j]
+                    dist_sq = max(dx * dx + dy * dy, MIN_DIST_SQ)
+                    scale = strength / (dist_sq * math.sqrt(dist_sq))
+                    fx += dx * scale
+                    fy += dy * scale
+                continue
+            dx, dy = x - mass_x, y - mass_y
+            dist_sq = dx * dx + dy * dy
+            inside = abs(x - cx) <= half and abs(y - cy) <= half
+            if not inside and 4.0 * half * half < theta_sq * dist_sq:
+                # Far enough: the whole cell acts as `count` points at its centre of mass
+                dist_sq = max(dist_sq, MIN_DIST_SQ)
+                scale = strength * count / (dist_sq * math.sqrt(dist_sq))
+                fx += dx * scale
+                fy += dy * scale
+            else:
+                stack.extend(children)
+        return fx, fy
+
+    def within(self, x, y, reach):
+        """Indices of the points in leaves whose cell comes within reach of (x, y)."""
+        found = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            cx, cy, half, count, mass_x, mass_y, children, indices = stack.pop()
+            if abs(x - cx) > half + reach or abs(y - cy) > half + reach:
+                continue
+            if children is None:
+                found.extend(indices)
+            else:
+                stack.extend(children)
+        return found
+
+
+class ForceLayout:
+    """
+    Force-directed layout: charge, link, collision, center and boundary forces.
+
+    charge_strength: pairwise inverse-square charge, positive repels (the node map uses 3000).
+    link_distance / link_strength: spring rest length and stiffness of a link.
+    collision_strength: push per pixel of overlap of two collision radii.
+    center_strength: pull of the anchor node towards the center.
+    boundary_strength: push per pixel a node's radius crosses the bounds.
+    alpha_decay: cooling over the iterations of one simulate() call.
+    velocity_decay: velocity multiplier applied every iteration (friction).
+    theta / barnes_hut: quadtree accuracy, and True / False / None (automatic).
+    """
+
+    def __init__(self, charge_strength=-10000.0, link_distance=150.0, link_strength=0.2,
+                 collision_strength=5.0, center_strength=0.1, boundary_strength=15.0,
+                 alpha_decay=0.05, velocity_decay=0.5, theta=0.9, barnes_hut=None):
+        self.charge_strength = charge_strength
+        self.link_distance = link_distance
+        self.link_strength = link_strength
+        self.collision_strength = collision_strength
+        self.center_strength = center_strength
+        self.boundary_strength = boundary_strength
+        self.alpha_decay = alpha_decay
+        self.velocity_decay = velocity_decay
+        self.theta = theta
+        self.barnes_hut = barnes_hut
+        self.iterations = 0  # Iterations run since construction
+
+    def uses_barnes_hut(self, count):
+        if self.barnes_hut is None:
+            return count >= BARNES_HUT_MIN_NODES
+        return self.barnes_hut
+
+    def simulate(self, names, positions, velocities, links, radii, bounds, iterations,
+                 anchor=None, center=None, exclusion=None):
+        """
+        Run iterations of the simulation over the nodes in names.
+
+        positions ({name: (x, y)}) and velocities ({name: [vx, vy]}) are
+        read and updated in place. links is a sequence of (name, name) pairs
+        (a pair listed twice pulls twice); pairs with a node outside names
+        are ignored. radii maps every name to its collision radius. bounds is
+        (left, top, right, bottom): node circles are pushed back inside and
+        clamped to it. The anchor node is held at center, and nodes inside
+        the exclusion rect (x, y, width, height) are pushed towards the left
+        bound.
+        """
+        if not names or iterations <= 0:
+            return
+        index = {name: i for i, name in enumerate(names)}
+        edges = [(index[a], index[b]) for a, b in links if a in index and b in index]
+        anchor_index = index.get(anchor) if anchor is not None else None
+        if center is None:
+            center = positions[anchor] if anchor_index is not None else (0.0, 0.0)
+        args = (edges, bounds, iterations, anchor_index, center, exclusion, self.uses_barnes_hut(len(names)))
+        if HAS_NUMPY:
+            pos = np.array([positions[name] for name in names], dtype=np.float64)
+            vel = np.array([velocities.get(name, (0.0, 0.0)) for name in names], dtype=np.float64)
+            rad = np.array([radii[name] for name in names], dtype=np.float64)
+            self._run_numpy(pos, vel, rad, *args)
+            pos, vel = pos.tolist(), vel.tolist()
+        else:
+            pos = [list(positions[name]) for name in names]
+            vel = [list(velocities.get(name, (0.0, 0.0))) for name in names]
+            self._run_python(pos, vel, [radii[name] for name in names], *args)
+        for i, name in enumerate(names):
+            positions[name] = (pos[i][0], pos[i][1])
+            velocities[name] = [vel[i][0], vel[i][1]]
+        self.iterations += iterations
+
+    def _tree_forces(self, xs, ys, radii, force_x, force_y):
+        """Barnes–Hut charge plus quadtree-culled collisions, added into force_x / force_y."""
+        tree = QuadTree(xs, ys)
+        max_radius = max(radii)
+        strength = self.collision_strength
+        for i in range(len(xs)):
+            fx, fy = tree.charge(i, self.charge_strength, self.theta)
+            force_x[i] += fx
+            force_y[i] += fy
+            x1, y1, radius1 = xs[i], ys[i], radii[i]
+            for j in tree.within(x1, y1, radius1 + max_radius):
+                if j <= i:
+                    continue
+                dx, dy = x1 - xs[j], y1 - ys[j]
+                dist_sq = dx * dx + dy * dy
+                min_dist = radius1 + radii[j]
+                if dist_sq > MIN_DIST_SQ and dist_sq < min_dist * min_dist:
+                    dist = math.sqrt(dist_sq)
+                    scale = (min_dist - dist) * strength / dist
+                    force_x[i] += dx * scale
+                    force_y[i] += dy * scale
+                    force_x[j] -= dx * scale
+                    force_y[j] -= dy * scale
+
+    def _run_numpy(self, pos, vel, rad, edges, bounds, iterations, anchor, center, exclusion, barnes_hut):
+        left, top, right, bottom = bounds
+        boundary = self.boundary_strength
+        edge_a = np.array([a for a, b in edges], dtype=np.intp)
+        edge_b = np.array([b for a, b in edges], dtype=np.intp)
+        # Clamp range of every node (the radius keeps the whole circle inside)
+        low_x, high_x = left + rad, right - rad
+        low_y, high_y = top + rad, bottom - rad
+        min_dist = rad[:, None] + rad[None, :]
+        for iteration in range(iterations):
+            x, y = pos[:, 0], pos[:, 1]
+            forces = np.zeros_like(pos)
+
+            if barnes_hut:
+                force_x, force_y = [0.0] * len(pos), [0.0] * len(pos)
+                self._tree_forces(x.tolist(), y.tolist(), rad.tolist(), force_x, force_y)
+                forces[:, 0] = force_x
+                forces[:, 1] = force_y
+            else:
+                # 1. CHARGE: strength * d / |d|³ summed over all pairs (d = p_i - p_j)
+                delta = pos[:, None, :] - pos[None, :, :]
+                dist_sq = np.einsum("ijk,ijk->ij", delta, delta)
+                clamped = np.maximum(dist_sq, MIN_DIST_SQ)
+                scale = self.charge_strength / (clamped * np.sqrt(clamped))
+                np.fill_diagonal(scale, 0.0)
+                # 3. COLLISION: push overlapping collision circles apart
+                dist = np.sqrt(dist_sq)
+                overlapping = (dist_sq > MIN_DIST_SQ) & (dist < min_dist)
+                scale += np.where(overlapping, (min_dist - dist) * self.collision_strength / np.maximum(dist, 1e-9), 0.0)
+                forces += np.einsum("ij,ijk->ik", scale, delta)
+
+            # 2. LINK: springs towards link_distance
+            if len(edge_a):
+                delta = pos[edge_b] - pos[edge_a]
+                dist = np.maximum(np.sqrt(np.einsum("ij,ij->i", delta, delta)), 0.01)
+                pull = delta * (self.link_strength * (dist - self.link_distance) / dist)[:, None]
+                np.add.at(forces, edge_a, pull)
+                np.add.at(forces, edge_b, -pull)
+
+            # 4. CENTER: anchor pulled to the center
+            if anchor is not None:
+                forces[anchor, 0] += (center[0] - pos[anchor, 0]) * self.center_strength
+                forces[anchor, 1] += (center[1] - pos[anchor, 1]) * self.center_strength
+
+            # 5. BOUNDARY: circles crossing the bounds are pushed back in
+            forces[:, 0] += np.where(x - rad < left, (left + rad - x) * boundary, 0.0)
+            forces[:, 0] -= np.where(x + rad > right, (x + rad - right) * boundary, 0.0)
+            forces[:, 1] += np.where(y - rad < top, (top + rad - y) * boundary, 0.0)
+            forces[:, 1] -= np.where(y + rad > bottom, (y + rad - bottom) * boundary, 0.0)
+            if exclusion is not None:
+                ex, ey, ew, eh = exclusion
+                inside = (ex - rad <= x) & (x <= ex + ew + rad) & (ey - rad <= y) & (y <= ey + eh + rad)
+                forces[:, 0] += np.where(inside, (left - x) * boundary * 2.0, 0.0)
+
+            # Integrate with cooling and friction, then clamp to the bounds
+            alpha = 1.0 - (iteration / iterations) * self.alpha_decay
+            vel += forces * alpha
+            vel *= self.velocity_decay
+            pos += vel
+            np.maximum(low_x, np.minimum(high_x, pos[:, 0]), out=pos[:, 0])
+            np.maximum(low_y, np.minimum(high_y, pos[:, 1]), out=pos[:, 1])
+            if anchor is not None:
+                pos[anchor] = center
+                vel[anchor] = 0.0
+
+    def _run_python(self, pos, vel, rad, edges, bounds, iterations, anchor, center, exclusion, barnes_hut):
+        left, top, right, bottom = bounds
+        boundary = self.boundary_strength
+        count = len(pos)
+        for iteration in range(iterations):
+            force_x, force_y = [0.0] * count, [0.0] * count
+            if barnes_hut:
+                self._tree_forces([p[0] for p in pos], [p[1] for p in pos], rad, force_x, force_y)
+            else:
+                for i in range(count):
+                    x1, y1 = pos[i]
+                    for j in range(i + 1, count):
+                        dx, dy = x1 - pos[j][0], y1 - pos[j][1]
+                        dist_sq = dx * dx + dy * dy
+                        # 1. CHARGE
+                        clamped = max(dist_sq, MIN_DIST_SQ)
+                        scale = self.charge_strength / (clamped * math.sqrt(clamped))
+                        # 3. COLLISION
+                        min_dist = rad[i] + rad[j]
+                        if dist_sq > MIN_DIST_SQ and dist_sq < min_dist * min_dist:
+                            dist = math.sqrt(dist_sq)
+                            scale += (min_dist - dist) * self.collision_strength / dist
+                        force_x[i] += dx * scale
+                        force_y[i] += dy * scale
+                        force_x[j] -= dx * scale
+                        force_y[j] -= dy * scale
+
+            # 2. LINK
+            for a, b in edges:
+                dx, dy = pos[b][0] - pos[a][0], pos[b][1] - pos[a][1]
+                dist = max(math.sqrt(dx * dx + dy * dy), 0.01)
+                scale = self.link_strength * (dist - self.link_distance) / dist
+                force_x[a] += dx * scale
+                force_y[a] += dy * scale
+                force_x[b] -= dx * scale
+                force_y[b] -= dy * scale
+
+            # 4. CENTER
+            if anchor is not None:
+                force_x[anchor] += (center[0] - pos[anchor][0]) * self.center_strength
+                force_y[anchor] += (center[1] - pos[anchor][1]) * self.center_strength
+
+            # 5. BOUNDARY
+            for i in range(count):
+                x, y = pos[i]
+                radius = rad[i]
+                if x - radius < left:
+                    force_x[i] += (left + radius - x) * boundary
+                if x + radius > right:
+                    force_x[i] -= (x + radius - right) * boundary
+                if y - radius < top:
+                    force_y[i] += (top + radius - y) * boundary
+                if y + radius > bottom:
+                    force_y[i] -= (y + radius - bottom) * boundary
+                if exclusion is not None:
+                    ex, ey, ew, eh = exclusion
+                    if ex - radius <= x <= ex + ew + radius and ey - radius <= y <= ey + eh + radius:
+                        force_x[i] += (left - x) * boundary * 2.0
+
+            alpha = 1.0 - (iteration / iterations) * self.alpha_decay
+            for i in range(count):
+                velocity = vel[i]
+                velocity[0] = (velocity[0] + force_x[i] * alpha) * self.velocity_decay
+                velocity[1] = (velocity[1] + force_y[i] * alpha) * self.velocity_decay
+                if i == anchor:
+                    pos[i] = [center[0], center[1]]
+                    vel[i] = [0.0, 0.0]
+                    continue
+                radius = rad[i]
+                pos[i] = [max(left + radius, min(right - radius, pos[i][0] + velocity[0])),
+                          max(top + radius, min(bottom - radius, pos[i][1] + velocity[1]))]
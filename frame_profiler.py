@@ -0,0 +1,177 @@
+"""
+Frame Profiler Module
+Per-section frame timing with rolling percentiles, an overlay and CSV export.
+
+The main loop is one long sequence of module-level blocks (state updates,
+event handling and the command parser, scene drawing, the node map
+simulation, visual effects, presenting the frame), so the profiler works
+with laps: begin_frame() starts the clock and each lap(name) charges the
+time since the previous lap to a section. Sections that only run on some
+frames (the command parser) use start()/stop() or the section() context
+manager and are timed independently of the laps around them.
+
+The last `window` frames are kept, so p50/p95/p99 per section are always
+computed over a rolling window. The overlay (toggled with the `perf`
+command) shows them in the top-right corner, and the retained frames can be
+written to CSV, one row per frame and one column per section.
+"""
+
+import csv
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame  # type: ignore
+
+from surface_pool import fill_tint
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+class FrameProfiler:
+    """Lap and scoped timers for the main loop, with rolling percentiles per section."""
+
+    OVERLAY_REFRESH_FRAMES = 10  # Overlay text is re-rendered every N frames
+    OVERLAY_ALPHA = 190  # Black backing panel opacity
+    OVERLAY_TEXT_COLOR = (0, 255, 120)
+    OVERLAY_WARN_COLOR = (255, 200, 0)
+
+    def __init__(self, window=300, budget_ms=1000.0 / 30):
+        self.window = window
+        self.budget_ms = budget_ms  # p95 above this is highlighted in the overlay
+        self.overlay = False
+        self.used = False  # True once the overlay has been turned on (CSV is only dumped then)
+        self.frames = 0
+        self._history = deque(maxlen=window)
+        self._sections = []  # Section names in first-seen order (overlay and CSV column order)
+        self._current = {}
+        self._open = {}
+        self._frame_start = None
+        self._last = None
+        self._overlay_lines = []
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        self._current = {}
+        self._open.clear()
+        self._frame_start = self._last = time.perf_counter()
+
+    def lap(self, name):
+        """Charge the time since the previous lap (or begin_frame) to a section."""
+        if self._last is None:
+            return
+        now = time.perf_counter()
+        self._add(name, (now - self._last) * 1000.0)
+        self._last = now
+
+    def start(self, name):
+        """Start an independent timer for a section that does not run every frame."""
+        self._open[name] = time.perf_counter()
+
+    def stop(self, name):
+        """Stop a timer started with start(); ignored if it is not running."""
+        started = self._open.pop(name, None)
+        if started is not None:
+            self._add(name, (time.perf_counter() - started) * 1000.0)
+
+    @contextmanager
+    def section(self, name):
+        """Scoped timer: with profiler.section("name"): ..."""
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop(name)
+
+    def _add(self, name, elapsed_ms):
+        if name not in self._current:
+            self._current[name] = 0.0
+            if name not in self._sections:
+                self._sections.append(name)
+        self._current[name] += elapsed_ms
+
+    def end_frame(self):
+        """Close the frame: record every section plus the whole frame ("total")."""
+        if self._frame_start is None:
+            return
+        self._add("total", (time.perf_counter() - self._frame_start) * 1000.0)
+        # Timers still open here were left running by an early exit; drop them
+        self._open.clear()
+        self._history.append(self._current)
+        self._frame_start = self._last = None
+        self.frames += 1
+        if self.overlay and self.frames % self.OVERLAY_REFRESH_FRAMES == 0:
+            self._overlay_lines = []
+
+    def last_frame(self):
+        """{section: ms} of the last recorded frame (empty before the first one)."""
+        return self._history[-1] if self._history else {}
+
+    def stats(self):
+        """
+        Return {section: {"samples", "last", "mean", "p50", "p95", "p99", "max"}} in ms
+        over the rolling window. Sections are only sampled on frames where they ran.
+        """
+        result = {}
+        last = self._history[-1] if self._history else {}
+        for name in self._sections:
+            values = sorted(frame[name] for frame in self._history if name in frame)
+            if not values:
+                continue
+            result[name] = {
+                "samples": len(values),
+                "last": last.get(name, 0.0),
+                "mean": sum(values) / len(values),
+                "p50": percentile(values, 0.50),
+                "p95": percentile(values, 0.95),
+                "p99": percentile(values, 0.99),
+                "max": values[-1],
+            }
+        return result
+
+    def toggle_overlay(self):
+        self.overlay = not self.overlay
+        self.used = self.used or self.overlay
+        self._overlay_lines = []
+        return self.overlay
+
+    def draw_overlay(self, surface, font):
+        """Draw the per-section table in the top-right corner of surface. Returns its rect."""
+        if not self.overlay:
+            return None
+        if not self._overlay_lines:
+            header = f"{'section':<15}{'last':>7}{'p50':>7}{'p95':>7}{'p99':>7}"
+            self._overlay_lines = [font.render(header, True, self.OVERLAY_TEXT_COLOR)]
+            for name, row in self.stats().items():
+                color = self.OVERLAY_WARN_COLOR if row["p95"] > self.budget_ms else self.OVERLAY_TEXT_COLOR
+                text = f"{name[:14]:<15}{row['last']:7.2f}{row['p50']:7.2f}{row['p95']:7.2f}{row['p99']:7.2f}"
+                self._overlay_lines.append(font.render(text, True, color))
+        line_height = font.get_linesize()
+        width = max(line.get_width() for line in self._overlay_lines) + 12
+        height = line_height * len(self._overlay_lines) + 10
+        rect = pygame.Rect(surface.get_width() - width - 8, 8, width, height)
+        fill_tint(surface, (0, 0, 0), self.OVERLAY_ALPHA, rect)
+        pygame.draw.rect(surface, self.OVERLAY_TEXT_COLOR, rect, 1)
+        y = rect.y + 5
+        for line in self._overlay_lines:
+            surface.blit(line, (rect.x + 6, y))
+            y += line_height
+        return rect
+
+    def dump_csv(self, path):
+        """Write the retained frames to path (one row per frame, ms per section). Returns the row count."""
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + self._sections)
+            first = self.frames - len(self._history)
+            for offset, frame in enumerate(self._history):
+                writer.writerow([first + offset] + [f"{frame[name]:.3f}" if name in frame else ""
+                                                    for name in self._sections])
+        return len(self._history)
@@ -0,0 +1,133 @@
+"""
+Glyph Atlas Module
+Pre-rendered single-character surfaces for character-level effects.
+
+Matrix rain, Grid Bleed rain, NullParticles and DNA strands used to call
+font.render() for every character on every frame. A GlyphAtlas renders each
+(glyph, color, alpha, rotation) cell once and serves the cached surface
+afterwards, so those effects draw by blitting atlas cells only.
+
+Colors and alpha are quantized to fixed steps so that continuous fades
+(rain tails, particle fade-outs, DNA hue cycling) map onto a bounded set
+of cells. Alpha is baked into the cell's per-pixel alpha, so cells can be
+blitted directly without a per-frame set_alpha call.
+"""
+
+import weakref
+
+import pygame  # type: ignore
+
+
+_MISSING = object()
+
+
+class GlyphAtlas:
+    """Cache of pre-rendered glyph cells for one font."""
+
+    DEFAULT_COLOR_STEP = 8
+    DEFAULT_ALPHA_STEP = 16
+    DEFAULT_MAX_CELLS = 8192
+
+    def __init__(self, font, color_step=DEFAULT_COLOR_STEP, alpha_step=DEFAULT_ALPHA_STEP,
+                 max_cells=DEFAULT_MAX_CELLS):
+        self.font = font
+        self.color_step = color_step
+        self.alpha_step = alpha_step
+        self.max_cells = max_cells
+        self._cells = {}
+        self._lookup = {}
+        self.hits = 0
+        self.misses = 0
+
+    def quantize_color(self, color):
+        """Snap an RGB color to the atlas color grid."""
+        step = self.color_step
+        return tuple(min(255, max(0, int(round(c / step)) * step)) for c in color[:3])
+
+    def quantize_alpha(self, alpha):
+        """Snap an alpha value to the atlas alpha grid (255 stays opaque)."""
+        if alpha >= 255:
+            return 255
+        if alpha <= 0:
+            return 0
+        return min(255, int(round(alpha / self.alpha_step)) * self.alpha_step)
+
+    def cell(self, char, color, alpha=255, angle=0):
+        """
+        Return the cached surface for a glyph, or None for glyphs the font cannot render.
+
+        Args:
+            char: Character to draw
+            color: RGB color (quantized to color_step)
+            alpha: 0-255 opacity (quantized to alpha_step and baked into the cell)
+            angle: Rotation in degrees (e.g. 180 for the upside-down DNA 'A')
+        """
+        raw_key = (char, color, alpha, angle)
+        surf = self._lookup.get(raw_key, _MISSING)
+        if surf is not _MISSING:
+            self.hits += 1
+            return surf
+        key = (char, self.quantize_color(color), self.quantize_alpha(alpha), angle)
+        surf = self._cells.get(key, _MISSING)
+        if surf is _MISSING:
+            surf = self._render(*key)
+            self.misses += 1
+            if len(self._cells) >= self.max_cells:
+                self._cells.clear()
+            self._cells[key] = surf
+        else:
+            self.hits += 1
+        # Exact-input lookup table so repeated colors skip quantization entirely
+        if len(self._lookup) >= self.max_cells * 4:
+            self._lookup.clear()
+        self._lookup[raw_key] = surf
+        return surf
+
+    def prerender(self, chars, colors, alphas=(255,), angle=0):
+        """Warm the atlas with every combination of chars x colors x alphas."""
+        for char in chars:
+            for color in colors:
+                for alpha in alphas:
+                    self.cell(char, color, alpha, angle)
+
+    def stats(self):
+        """Return a dictionary snapshot of the atlas counters."""
+        return {"cells": len(self._cells), "hits": self.hits, "misses": self.misses}
+
+    def _render(self, char, color, alpha, angle):
+        if alpha <= 0:
+            return None
+        try:
+            surf = self.font.render(char, True, color)
+        except pygame.error:
+            # Zero-width glyphs (variation selectors, missing emoji) cannot be rendered
+            return None
+        if angle:
+            surf = pygame.transform.rotate(surf, angle)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        if alpha < 255:
+            surf.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        return surf
+
+
+def color_ramp(start, end, steps):
+    """Return `steps` RGB colors linearly interpolated from start to end (inclusive)."""
+    if steps <= 1:
+        return [tuple(start[:3])]
+    return [
+        tuple(int(start[c] + (end[c] - start[c]) * i / (steps - 1)) for c in range(3))
+        for i in range(steps)
+    ]
+
+
+_ATLASES = weakref.WeakKeyDictionary()
+
+
+def atlas_for(font):
+    """Return the shared GlyphAtlas for a font, creating it on first use."""
+    atlas = _ATLASES.get(font)
+    if atlas is None:
+        atlas = GlyphAtlas(font)
+        _ATLASES[font] = atlas
+    return atlas
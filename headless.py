@@ -0,0 +1,210 @@
+"""
+Headless Module
+Offscreen engine runs: SDL dummy video driver, scripted commands and a frame time report.
+
+truth_engine_X10.py opens its window at import time and keeps all of its
+state in module globals driven by the `while running` loop, so the only way
+to exercise the command and scene pipeline was to sit in front of it and
+type. Started with --headless, the engine selects SDL's dummy video and
+audio drivers before pygame.init(), so the display surface is an offscreen
+buffer and no window or audio device is needed (CI boxes, servers, SSH).
+
+A HeadlessRun drives the unchanged main loop for a fixed number of frames:
+begin_frame() / end_frame() time every frame, and end_frame() reports when
+the frame count is reached. The scripted commands (--commands "a;b", or a
+macro file with --script / --macro, see command_macro.py) are replayed by
+a MacroPlayer every `interval` frames, through the same path as Enter.
+HeadlessClock replaces pygame.time.Clock so frames are not throttled to
+FPS: every tick reports exactly one frame period, which keeps dt-driven
+animation identical from run to run while the loop runs as fast as the
+machine allows (--realtime keeps the FPS clock).
+
+The starting state can be pinned for benchmarking (see
+benchmarks/bench_scenes.py): --stage plays the final verdict animation
+forward to one of its stages and holds it there, --resonance lights the first N node map
+resonance nodes, --node-map opens the node map, and --fresh ignores the
+saved state record so a run does not depend on earlier sessions.
+
+At the end the run prints mean / p50 / p95 / p99 / max frame times, the
+allocations per frame (pooled surfaces created, fonts constructed and the
+growth of the Python heap in blocks), the per-section breakdown of the
+FrameProfiler and the per-command timings of the replay, and can write the
+same report as JSON (--report path). The first --warmup frames are left
+out of the frame time and allocation figures.
+
+Usage:
+    python truth_engine_X10.py --headless --frames 600 --commands "help;essay 019;node_map"
+    python truth_engine_X10.py --headless --frames 2000 --macro load.macro --interval 5
+    python truth_engine_X10.py --headless --fresh --frames 150 --warmup 30 --node-map --resonance 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from command_macro import MacroPlayer, load_macro, parse_macro
+from frame_profiler import percentile
+
+HEADLESS_SCENES = ("initial_transmission", "dashboard", "essays_command", "final_verdict", "history_log")
+
+
+def use_dummy_drivers():
+    """Point SDL at its offscreen video driver and silent audio driver. Call before pygame.init()."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class HeadlessClock:
+    """Stand-in for pygame.time.Clock that never sleeps and always reports one frame period."""
+
+    def __init__(self, fps):
+        self.fps = fps
+
+    def tick(self, framerate=0):
+        return round(1000 / (framerate or self.fps))
+
+    def get_fps(self):
+        return float(self.fps)
+
+
+def frame_time_summary(times_ms):
+    """{"mean", "p50", "p95", "p99", "max"} in ms of a list of frame times."""
+    values = sorted(times_ms)
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 0.50),
+        "p95": percentile(values, 0.95),
+        "p99": percentile(values, 0.99),
+        "max": values[-1],
+    }
+
+
+class HeadlessRun:
+    """A fixed number of offscreen frames, optionally replaying a command macro."""
+
+    def __init__(self, frames=300, player=None, scene="dashboard", realtime=False, report_path=None,
+                 warmup=0, stage=0, resonance=None, node_map=False, fresh=False):
+        self.frames = frames
+        self.player = player  # MacroPlayer of the scripted commands, or None
+        self.scene = scene
+        self.realtime = realtime  # Keep the FPS clock instead of HeadlessClock
+        self.report_path = report_path
+        self.warmup = warmup  # Leading frames left out of the statistics
+        self.stage = stage  # Final verdict stage to start in
+        self.resonance = resonance  # Number of resonance nodes to activate, or None to leave them
+        self.node_map = node_map  # Start with the node map open
+        self.fresh = fresh  # Do not load the saved state record
+        self.frame = 0
+        self.frame_times = []
+        self.allocations = []  # {"surfaces", "fonts", "blocks"} per frame
+        self._frame_start = None
+        self._frame_blocks = 0
+        self._started = None
+
+    @classmethod
+    def from_argv(cls, argv):
+        """HeadlessRun for the engine's command line, or None if --headless is not given."""
+        parser = argparse.ArgumentParser(description="Run the engine offscreen with a scripted command stream.")
+        parser.add_argument("--headless", action="store_true", help="offscreen run (SDL dummy video driver)")
+        parser.add_argument("--frames", type=int, default=300, help="frames to run before exiting")
+        parser.add_argument("--commands", default="", help="';'-separated terminal commands")
+        parser.add_argument("--script", "--macro", dest="script", help="macro file, one terminal command per line")
+        parser.add_argument("--interval", type=int, default=10, help="frames between two commands")
+        parser.add_argument("--realtime", action="store_true", help="hold FPS instead of running unthrottled")
+        parser.add_argument("--scene", choices=HEADLESS_SCENES, default="dashboard", help="scene to start in")
+        parser.add_argument("--report", help="write the frame time report to this JSON file")
+        parser.add_argument("--warmup", type=int, default=0, help="leading frames left out of the statistics")
+        parser.add_argument("--stage", type=int, default=0, help="final verdict stage to start in (0-3)")
+        parser.add_argument("--resonance", type=int, help="activate the first N node map resonance nodes")
+        parser.add_argument("--node-map", action="store_true", help="start with the node map open")
+        parser.add_argument("--fresh", action="store_true", help="ignore the saved state record")
+        args, _ = parser.parse_known_args(argv)
+        if not args.headless:
+            return None
+        steps = parse_macro(args.commands.replace(";", "\n"))
+        if args.script:
+            steps += load_macro(args.script)
+        player = MacroPlayer(steps, interval=args.interval, realtime=args.realtime,
+                             name=args.script or "--commands") if steps else None
+        return cls(args.frames, player, args.scene, args.realtime, report_path=args.report, warmup=args.warmup,
+                   stage=args.stage, resonance=args.resonance, node_map=args.node_map, fresh=args.fresh)
+
+    def begin_frame(self):
+        """Start timing a frame."""
+        if self._started is None:
+            self._started = time.perf_counter()
+        self._frame_blocks = sys.getallocatedblocks()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self, surfaces=0, fonts=0):
+        """
+        Record the frame time and allocations (surfaces / fonts created by the
+        pools this frame). Returns True once the run has done all its frames.
+        """
+        if self._frame_start is not None and self.frame >= self.warmup:
+            self.frame_times.append((time.perf_counter() - self._frame_start) * 1000.0)
+            self.allocations.append({"surfaces": surfaces, "fonts": fonts,
+                                     "blocks": sys.getallocatedblocks() - self._frame_blocks})
+        self._frame_start = None
+        self.frame += 1
+        return self.frame >= self.frames
+
+    def allocation_summary(self):
+        """{"surfaces", "fonts", "blocks"}: mean allocations per measured frame."""
+        count = len(self.allocations) or 1
+        return {key: sum(frame[key] for frame in self.allocations) / count
+                for key in ("surfaces", "fonts", "blocks")}
+
+    def report(self, profiler=None, final_scene=None, final_stage=None):
+        """
+        Dictionary report of the run; profiler (a FrameProfiler) adds the
+        per-section stats, final_scene / final_stage the scene (and final
+        verdict stage) the run ended in.
+        """
+        wall = time.perf_counter() - self._started if self._started is not None else 0.0
+        report = {
+            "frames": self.frame,
+            "warmup": min(self.warmup, self.frame),
+            "scene": self.scene,
+            "final_scene": final_scene,
+            "final_stage": final_stage,
+            "wall_seconds": wall,
+            "fps": self.frame / wall if wall else 0.0,
+            "frame_ms": frame_time_summary(self.frame_times),
+            "allocations": self.allocation_summary(),
+            "commands": self.player.timings if self.player else [],
+            "commands_skipped": len(self.player) - self.player.position if self.player else 0,
+        }
+        if profiler is not None:
+            report["sections"] = profiler.stats()
+        return report
+
+    def finish(self, profiler=None, final_scene=None, final_stage=None):
+        """Print the report (and write it to report_path when given). Returns the report."""
+        report = self.report(profiler, final_scene, final_stage)
+        frame_ms = report["frame_ms"]
+        print(f"HEADLESS RUN: {report['frames']} frames in {report['wall_seconds']:.2f} s "
+              f"({report['fps']:.1f} fps), {len(report['commands'])} commands")
+        print(f"  frame ms   mean {frame_ms['mean']:.2f}  p50 {frame_ms['p50']:.2f}  p95 {frame_ms['p95']:.2f}  "
+              f"p99 {frame_ms['p99']:.2f}  max {frame_ms['max']:.2f}")
+        allocations = report["allocations"]
+        print(f"  per frame  {allocations['surfaces']:.2f} surfaces  {allocations['fonts']:.2f} fonts  "
+              f"{allocations['blocks']:+.1f} heap blocks" + (f"  (after {report['warmup']} warmup frames)"
+                                                             if report["warmup"] else ""))
+        for name, row in report.get("sections", {}).items():
+            print(f"  {name:<15} mean {row['mean']:7.2f}  p95 {row['p95']:7.2f}  max {row['max']:7.2f}  "
+                  f"({row['samples']} frames)")
+        if self.player is not None and self.player.timings:
+            for line in self.player.report_lines()[1:]:
+                print(line)
+        if report["commands_skipped"]:
+            print(f"  {report['commands_skipped']} commands not reached - raise --frames or lower --interval")
+        if self.report_path:
+            with open(self.report_path, "w", encoding="utf-8") as file:
+                json.dump(report, file, indent=2, ensure_ascii=False)
+            print(f"  report written to {self.report_path}")
+        return report
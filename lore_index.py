@@ -0,0 +1,156 @@
+"""
+Lore Index Module
+One pre-normalized search service over every lore collection.
+
+The `#term` and `search term` commands each looped over WORLD_RECORDS_DATA,
+NAVIGATOR_COUNSEL_QUOTES and SYSTEM_DIRECTIVES and lower-cased every title,
+detail and quote on every query. A LoreIndex flattens all lore collections
+(including LIVING_WITNESS_DOSSIER, GRID_BLEED_EVENT_DATA and
+OMEGA_OVERRIDE_TEXTS) into LoreEntry records once, lower-cases them once, and
+joins them into a single haystack string with an offset table. A query is
+then a handful of str.find() calls over that string plus a bisect per hit.
+
+Matching keeps the old semantics exactly: a case-insensitive substring of an
+entry's title or text. Hits come back as LoreHit objects (entry, field and
+character offset), in collection order, and each command formats them.
+substring_spans() finds the same matches in a formatted result line, for
+highlighting.
+"""
+
+from bisect import bisect_right
+
+# Separators that cannot occur in a lower-cased query, so no match spans two fields
+_FIELD_SEPARATOR = "\x01"
+_ENTRY_SEPARATOR = "\x00"
+
+
+def substring_spans(text, term):
+    """(start, end) of every case-insensitive, non-overlapping occurrence of term in text."""
+    needle = term.lower()
+    lowered = text.lower()
+    if not needle or len(lowered) != len(text):
+        return []  # Lower-casing changed the length, so offsets would not line up
+    spans = []
+    position = lowered.find(needle)
+    while position != -1:
+        spans.append((position, position + len(needle)))
+        position = lowered.find(needle, position + len(needle))
+    return spans
+
+
+class LoreEntry:
+    """One searchable lore record."""
+
+    __slots__ = ("collection", "key", "title", "text")
+
+    def __init__(self, collection, key, title, text):
+        self.collection = collection  # e.g. "world_record", "quote", "dossier"
+        self.key = key                # WR id, 1-based number, or path inside a nested collection
+        self.title = title or ""
+        self.text = text or ""
+
+
+class LoreHit:
+    """A matching entry, with the field and offset of the first occurrence."""
+
+    __slots__ = ("entry", "field", "offset")
+
+    def __init__(self, entry, field, offset):
+        self.entry = entry
+        self.field = field    # "title" or "text"
+        self.offset = offset  # Character offset of the match in that field
+
+    def __repr__(self):
+        return f"LoreHit({self.entry.collection!r}, {self.entry.key!r}, {self.field!r}, {self.offset})"
+
+
+def flatten(data, path=()):
+    """Yield (path, text) for every string inside nested dicts and lists (list items are 1-based)."""
+    if isinstance(data, str):
+        yield path, data
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten(value, path + (key,))
+    elif isinstance(data, (list, tuple)):
+        for number, value in enumerate(data, start=1):
+            yield from flatten(value, path + (number,))
+
+
+class LoreIndex:
+    """Pre-lowered haystack over a list of LoreEntry records."""
+
+    def __init__(self, entries=()):
+        self.entries = []
+        self._parts = []
+        self._starts = []  # Haystack offset of each entry's title
+        self._length = 0
+        self._haystack = None
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry):
+        title = entry.title.lower()
+        text = entry.text.lower()
+        # Offsets into the lowered text are only valid if lowering kept the length
+        if len(title) != len(entry.title):
+            title = "".join(c.lower() if len(c.lower()) == 1 else c for c in entry.title)
+        if len(text) != len(entry.text):
+            text = "".join(c.lower() if len(c.lower()) == 1 else c for c in entry.text)
+        self.entries.append(entry)
+        self._starts.append(self._length)
+        part = title + _FIELD_SEPARATOR + text + _ENTRY_SEPARATOR
+        self._parts.append(part)
+        self._length += len(part)
+        self._haystack = None
+
+    def add_collection(self, collection, items, title_key=None, text_key=None, id_key=None):
+        """
+        Add a flat list: strings (numbered from 1) or dicts whose title/text/id
+        come from the given keys.
+        """
+        for number, item in enumerate(items, start=1):
+            if isinstance(item, dict):
+                key = item.get(id_key, number) if id_key else number
+                self.add(LoreEntry(collection, key, item.get(title_key, "") if title_key else "",
+                                   item.get(text_key, "") if text_key else ""))
+            else:
+                self.add(LoreEntry(collection, number, "", item))
+
+    def add_nested(self, collection, data):
+        """Add every string of a nested dict/list structure, keyed by its path."""
+        for path, text in flatten(data):
+            self.add(LoreEntry(collection, path, "", text))
+
+    def search(self, term, limit=None):
+        """Return LoreHits for every entry whose title or text contains term (case-insensitive)."""
+        needle = term.lower()
+        if not needle or _FIELD_SEPARATOR in needle or _ENTRY_SEPARATOR in needle:
+            return []
+        if self._haystack is None:
+            self._haystack = "".join(self._parts)
+        haystack = self._haystack
+        starts = self._starts
+        hits = []
+        position = haystack.find(needle)
+        while position != -1:
+            index = bisect_right(starts, position) - 1
+            entry = self.entries[index]
+            offset = position - starts[index]
+            title_length = len(entry.title)
+            if offset < title_length:
+                hits.append(LoreHit(entry, "title", offset))
+            else:
+                hits.append(LoreHit(entry, "text", offset - title_length - 1))
+            if limit is not None and len(hits) >= limit:
+                break
+            # One hit per entry: continue after this entry
+            next_start = starts[index + 1] if index + 1 < len(starts) else len(haystack)
+            position = haystack.find(needle, next_start)
+        return hits
+
+    def stats(self):
+        """Return a dictionary snapshot of the index size."""
+        return {"entries": len(self.entries), "characters": self._length}
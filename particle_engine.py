@@ -0,0 +1,279 @@
+"""
+Particle Engine Module
+Struct-of-arrays particle systems with batched update and cull.
+
+The celebration fireworks, the HistoryLogScreen "GARBAGE 4 LIFE!" fireworks,
+the NullParticle dispersal of the Grid Bleed final verdict and the
+particle_burst visual effect each kept one Python dict or object per
+particle and moved them one at a time, removing dead particles with
+list.remove() inside the loop. A ParticleSystem keeps every particle
+attribute (position, velocity, remaining life, size, color, glyph) in one
+array per attribute, so a frame's update and cull are a handful of whole-
+array operations regardless of the particle count.
+
+Each effect is now just an Emitter configuration (how many particles, speed,
+spread, size, life, color jitter) plus the physics of the system it emits
+into (gravity, per-update drag, fade). Drawing stays with the caller:
+render_data() hands back the visible particles, already converted to ints,
+ready to be turned into sprites and submitted through a SpriteBatch.
+
+NumPy is used when available; without it the same arrays are plain Python
+lists updated in a loop, so behaviour is identical, just slower.
+"""
+
+import math
+import random
+
+try:
+    import numpy as np  # type: ignore
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+class Emitter:
+    """
+    Configuration of one burst of particles.
+
+    Ranges are (low, high) tuples: count and size are inclusive integer
+    ranges, speed and life are uniform float ranges (life in milliseconds).
+    """
+
+    def __init__(self, count, speed, size, life, max_life=None, color_jitter=0,
+                 lift=0.0, ring=False, scatter=0, drift=0.0, glyphs=None):
+        self.count = count if isinstance(count, tuple) else (count, count)
+        self.speed = speed
+        self.size = size if isinstance(size, tuple) else (size, size)
+        self.life = life if isinstance(life, tuple) else (life, life)
+        # Alpha is life / max_life, so particles born with less life start dimmer
+        self.max_life = max_life if max_life is not None else self.life[1]
+        self.color_jitter = color_jitter  # Same +/- offset added to all three channels
+        self.lift = lift                  # Subtracted from vy (upward bias)
+        self.ring = ring                  # Evenly spaced angles instead of random ones
+        self.scatter = scatter            # +/- integer offset of each spawn position
+        self.drift = drift                # +/- uniform velocity added on each axis
+        self.glyphs = glyphs              # Characters picked at random per particle (None for sprites)
+
+
+class ParticleSystem:
+    """
+    Pool of particles sharing the same physics.
+
+    gravity: added to vy every second (pixels/s^2).
+    drag: velocity multiplier applied once per update() call.
+    fade: fraction of max_life over which particles fade out at the end of
+    their life (1.0 fades linearly over the whole life).
+    """
+
+    FIELDS = ("x", "y", "vx", "vy", "life", "max_life", "size", "r", "g", "b", "glyph")
+
+    def __init__(self, gravity=0.0, drag=1.0, fade=1.0, capacity=256):
+        self.gravity = gravity
+        self.drag = drag
+        self.fade = fade
+        self.count = 0
+        self.spawned = 0
+        self._rng = np.random.default_rng() if HAS_NUMPY else None
+        self._allocate(capacity)
+
+    def __len__(self):
+        return self.count
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        if HAS_NUMPY:
+            self.x = np.zeros(capacity)
+            self.y = np.zeros(capacity)
+            self.vx = np.zeros(capacity)
+            self.vy = np.zeros(capacity)
+            self.life = np.zeros(capacity)
+            self.max_life = np.ones(capacity)
+            self.size = np.zeros(capacity, dtype=np.int32)
+            self.r = np.zeros(capacity, dtype=np.int32)
+            self.g = np.zeros(capacity, dtype=np.int32)
+            self.b = np.zeros(capacity, dtype=np.int32)
+            self.glyph = np.zeros(capacity, dtype=np.int32)
+        else:
+            for name in self.FIELDS:
+                setattr(self, name, [])
+
+    def _grow(self, needed):
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        old = {name: getattr(self, name) for name in self.FIELDS}
+        self._allocate(capacity)
+        for name, values in old.items():
+            getattr(self, name)[:self.count] = values[:self.count]
+
+    def clear(self):
+        """Drop every particle."""
+        self.count = 0
+        if not HAS_NUMPY:
+            for name in self.FIELDS:
+                getattr(self, name).clear()
+
+    def emit(self, x, y, vx, vy, life, max_life, size, color, glyph=0):
+        """
+        Append particles. Every argument is either a scalar shared by all new
+        particles or a sequence with one value per particle; color is an
+        (r, g, b) tuple or a sequence of them.
+        """
+        n = max((len(v) for v in (x, y, vx, vy, life, max_life, size, glyph)
+                 if isinstance(v, (list, tuple)) or (HAS_NUMPY and isinstance(v, np.ndarray))),
+                default=1)
+        if HAS_NUMPY and isinstance(color, np.ndarray) and color.ndim == 2:
+            r, g, b = color[:, 0], color[:, 1], color[:, 2]
+        elif isinstance(color[0], (int, float)):
+            r, g, b = color[0], color[1], color[2]
+        else:
+            r = [c[0] for c in color]
+            g = [c[1] for c in color]
+            b = [c[2] for c in color]
+        values = dict(x=x, y=y, vx=vx, vy=vy, life=life, max_life=max_life, size=size,
+                      r=r, g=g, b=b, glyph=glyph)
+        if HAS_NUMPY:
+            if self.count + n > self.capacity:
+                self._grow(self.count + n)
+            for name, value in values.items():
+                getattr(self, name)[self.count:self.count + n] = value
+        else:
+            for name, value in values.items():
+                column = getattr(self, name)
+                if isinstance(value, (list, tuple)):
+                    column.extend(value)
+                else:
+                    column.extend([value] * n)
+        self.count += n
+        self.spawned += n
+        return n
+
+    def burst(self, emitter, x, y, color):
+        """Emit one burst of emitter's particles centred on (x, y) around a base color."""
+        n = random.randint(*emitter.count)
+        if n <= 0:
+            return 0
+        if HAS_NUMPY:
+            rng = self._rng
+            if emitter.ring:
+                angles = np.arange(n) / n * 2 * math.pi
+            else:
+                angles = rng.uniform(0, 2 * math.pi, n)
+            speeds = rng.uniform(emitter.speed[0], emitter.speed[1], n)
+            vx = np.cos(angles) * speeds
+            vy = np.sin(angles) * speeds - emitter.lift
+            if emitter.drift:
+                vx += rng.uniform(-emitter.drift, emitter.drift, n)
+                vy += rng.uniform(-emitter.drift, emitter.drift, n)
+            px = np.full(n, float(x))
+            py = np.full(n, float(y))
+            if emitter.scatter:
+                px += rng.integers(-emitter.scatter, emitter.scatter + 1, n)
+                py += rng.integers(-emitter.scatter, emitter.scatter + 1, n)
+            jitter = (rng.integers(-emitter.color_jitter, emitter.color_jitter + 1, n)
+                      if emitter.color_jitter else np.zeros(n, dtype=np.int32))
+            colors = np.clip(np.asarray(color[:3], dtype=np.int32)[None, :] + jitter[:, None], 0, 255)
+            size = rng.integers(emitter.size[0], emitter.size[1] + 1, n)
+            life = rng.uniform(emitter.life[0], emitter.life[1], n)
+            glyph = (np.array([ord(c) for c in emitter.glyphs])[rng.integers(0, len(emitter.glyphs), n)]
+                     if emitter.glyphs else 0)
+        else:
+            vx, vy, px, py, colors, size, life, glyph = [], [], [], [], [], [], [], []
+            for i in range(n):
+                angle = i / n * 2 * math.pi if emitter.ring else random.uniform(0, 2 * math.pi)
+                speed = random.uniform(*emitter.speed)
+                vx.append(math.cos(angle) * speed + (random.uniform(-emitter.drift, emitter.drift) if emitter.drift else 0.0))
+                vy.append(math.sin(angle) * speed - emitter.lift + (random.uniform(-emitter.drift, emitter.drift) if emitter.drift else 0.0))
+                offset = (random.randint(-emitter.scatter, emitter.scatter),
+                          random.randint(-emitter.scatter, emitter.scatter)) if emitter.scatter else (0, 0)
+                px.append(float(x + offset[0]))
+                py.append(float(y + offset[1]))
+                variation = random.randint(-emitter.color_jitter, emitter.color_jitter) if emitter.color_jitter else 0
+                colors.append(tuple(max(0, min(255, int(c) + variation)) for c in color[:3]))
+                size.append(random.randint(*emitter.size))
+                life.append(random.uniform(*emitter.life))
+                glyph.append(ord(random.choice(emitter.glyphs)) if emitter.glyphs else 0)
+        return self.emit(px, py, vx, vy, life, emitter.max_life, size, colors, glyph)
+
+    def update(self, dt):
+        """Advance every particle by dt seconds and cull the ones whose life ran out."""
+        n = self.count
+        if n == 0:
+            return 0
+        elapsed_ms = dt * 1000
+        gravity = self.gravity * dt
+        drag = self.drag
+        if HAS_NUMPY:
+            vx, vy = self.vx[:n], self.vy[:n]
+            if drag != 1.0:
+                vx *= drag
+                vy *= drag
+            self.x[:n] += vx * dt
+            self.y[:n] += vy * dt
+            if gravity:
+                vy += gravity
+            life = self.life[:n]
+            life -= elapsed_ms
+            alive = life > 0
+            kept = int(np.count_nonzero(alive))
+            if kept < n:
+                for name in self.FIELDS:
+                    column = getattr(self, name)
+                    column[:kept] = column[:n][alive]
+        else:
+            x, y, vx, vy, life = self.x, self.y, self.vx, self.vy, self.life
+            for i in range(n):
+                if drag != 1.0:
+                    vx[i] *= drag
+                    vy[i] *= drag
+                x[i] += vx[i] * dt
+                y[i] += vy[i] * dt
+                vy[i] += gravity
+                life[i] -= elapsed_ms
+            alive = [i for i in range(n) if life[i] > 0]
+            kept = len(alive)
+            if kept < n:
+                for name in self.FIELDS:
+                    column = getattr(self, name)
+                    column[:] = [column[i] for i in alive]
+        self.count = kept
+        return n - kept
+
+    def render_data(self, color_step=1, alpha_scale=1.0):
+        """
+        Return (x, y, size, color, alpha, glyph) tuples of every particle whose
+        alpha is above zero. Positions and alpha are ints, color is an (r, g, b)
+        tuple quantized down to multiples of color_step (for sprite caching),
+        and alpha is 255 * min(1, life / (max_life * fade)) * alpha_scale.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        fade = self.fade
+        if HAS_NUMPY:
+            alpha = (255 * np.minimum(1.0, self.life[:n] / (self.max_life[:n] * fade)) * alpha_scale).astype(np.int32)
+            visible = alpha > 0
+            if color_step > 1:
+                colors = np.stack((self.r[:n], self.g[:n], self.b[:n]), axis=1) // color_step * color_step
+            else:
+                colors = np.stack((self.r[:n], self.g[:n], self.b[:n]), axis=1)
+            return list(zip(self.x[:n][visible].astype(np.int32).tolist(),
+                            self.y[:n][visible].astype(np.int32).tolist(),
+                            self.size[:n][visible].tolist(),
+                            map(tuple, colors[visible].tolist()),
+                            alpha[visible].tolist(),
+                            self.glyph[:n][visible].tolist()))
+        data = []
+        for i in range(n):
+            alpha = int(255 * min(1.0, self.life[i] / (self.max_life[i] * fade)) * alpha_scale)
+            if alpha > 0:
+                color = (self.r[i] // color_step * color_step, self.g[i] // color_step * color_step,
+                         self.b[i] // color_step * color_step)
+                data.append((int(self.x[i]), int(self.y[i]), self.size[i], color, alpha, self.glyph[i]))
+        return data
+
+    def stats(self):
+        """Return a dictionary snapshot of the system counters."""
+        return {"live": self.count, "capacity": self.capacity if HAS_NUMPY else self.count,
+                "spawned": self.spawned, "numpy": HAS_NUMPY}
@@ -0,0 +1,764 @@
+"""
+Search Index Module
+Positional inverted index with boolean queries, BM25 ranking and snippet offsets.
+
+search_essays used to lower-case and substring-scan the title, tags and full
+text of every essay in ESSAY_DATABASE on each query (about 1.7 MB of text),
+inside the frame the command was typed in, and listed matches in dictionary
+order. An InvertedIndex tokenizes every document once, keeps per-field term
+postings with the character offset of each occurrence, and answers a query
+by merging the postings of its terms only. Every occurrence is stored with
+its character offset and its token position in the field, so phrases can be
+matched from the postings alone.
+
+Queries are parsed by parse_query():
+    maritime law               both terms (AND is implied between terms)
+    "legal name fraud"         the words next to each other, in this order
+    admiralty OR maritime      either term
+    law NOT maritime           law, but not maritime (also: law AND NOT maritime)
+    tag:legal title:"name"     a term or phrase restricted to the tags / title
+    (truth OR justice) fraud   parentheses group
+    NOT maritime               every document without maritime (unranked)
+Operators are case-insensitive; to search for one of the words and, or and
+not, quote it ("not"). A malformed query - an operator or filter with no
+term on one side (truth AND, OR truth, tag:), an unbalanced parenthesis or
+quote, an empty phrase - raises QuerySyntaxError instead of being guessed
+at. Documents are selected by intersecting, uniting and subtracting posting
+lists, and only the selected documents are ranked.
+
+Ranking is BM25 computed per field and summed with field weights (a title
+hit outweighs a tag hit, which outweighs a body hit), over the terms that are
+not negated. A query word with no exact match falls back to the indexed terms
+it is a prefix of, so partial words ("mari" → maritime) still find documents
+the way the old substring scan did; words inside a phrase must match exactly.
+
+Each hit carries the field and character offset of its best occurrence, so
+the caller can cut a snippet out of the original text without searching it
+again (see snippet()). A phrase hit is anchored on the whole phrase.
+highlight_terms() gives the indexed terms a query matched, and match_spans()
+the character ranges of those terms in any line of formatted results, so
+the context window can highlight hits without searching the text again.
+
+An index can be saved to a cache file together with a content hash of the
+documents it was built from. load() memory-maps the file and only reads the
+document table and the sorted term list; a term's postings are decoded from
+the mapped buffer the first time a query touches it. build_essay_index()
+uses the cache when its hash still matches and rebuilds (and rewrites it)
+when any document changed.
+"""
+
+import array
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import sys
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Mapping
+
+# Unicode letters and digits; underscores and punctuation separate tokens
+TOKEN_RE = re.compile(r"[^\W_]+")
+MAX_PREFIX_EXPANSION = 64  # Indexed terms a single unmatched query prefix may expand to
+CACHE_MAGIC = b"TEIX"
+CACHE_VERSION = 2  # 2: token positions stored after the character offsets
+SEARCH_TERM_COST = 100  # search_cost() units per expanded query term (a postings lookup and its scoring loop)
+SEARCH_DOC_COST = 20  # search_cost() units per (term, document) pair already decoded
+QUERY_OPERATORS = ("and", "or", "not")
+# Field filters of the query syntax → indexed field
+QUERY_FIELDS = {"tag": "tags", "tags": "tags", "title": "title"}
+QUERY_TOKEN_RE = re.compile(r'(?P<field>[^\W_]+):|"(?P<phrase>[^"]*)"?|(?P<open>\()|(?P<close>\))|(?P<word>[^\W_]+)')
+
+
+def tokenize(text):
+    """Return (term, start, end) for every token of text; term is lower-cased, offsets index text."""
+    return [(match.group().lower(), match.start(), match.end()) for match in TOKEN_RE.finditer(text)]
+
+
+def term_occurrences(text):
+    """
+    Map every lower-cased term of text to (character offsets, token positions)
+    of its occurrences in text; both lists are in text order.
+    """
+    occurrences = defaultdict(lambda: ([], []))
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        # Lower-casing the whole text at once is much faster and keeps offsets valid
+        for position, match in enumerate(TOKEN_RE.finditer(lowered)):
+            offsets, positions = occurrences[match.group()]
+            offsets.append(match.start())
+            positions.append(position)
+    else:
+        for position, match in enumerate(TOKEN_RE.finditer(text)):
+            offsets, positions = occurrences[match.group().lower()]
+            offsets.append(match.start())
+            positions.append(position)
+    return occurrences
+
+
+def query_terms(query):
+    """Unique lower-cased terms of a query string, in order of appearance."""
+    terms = []
+    for term, _, _ in tokenize(query):
+        if term not in terms:
+            terms.append(term)
+    return terms
+
+
+class QueryNode:
+    """
+    Node of a parsed query. kind is "term" or "phrase" (terms holds the
+    words; field restricts the match to one indexed field, None for any),
+    or "and" / "or" / "not" (children holds the operands).
+    """
+
+    __slots__ = ("kind", "terms", "field", "children")
+
+    def __init__(self, kind, terms=(), field=None, children=()):
+        self.kind = kind
+        self.terms = list(terms)
+        self.field = field
+        self.children = list(children)
+
+    def leaves(self):
+        """The term and phrase nodes that documents are ranked by (those not under a NOT)."""
+        if self.kind in ("term", "phrase"):
+            return [self]
+        if self.kind == "not":
+            return []
+        return [leaf for child in self.children for leaf in child.leaves()]
+
+    def __repr__(self):
+        if self.kind in ("term", "phrase"):
+            field = f"{self.field}:" if self.field else ""
+            words = " ".join(self.terms)
+            return field + (f'"{words}"' if self.kind == "phrase" else words)
+        if self.kind == "not":
+            return f"NOT {self.children[0]!r}"
+        return "(" + f" {self.kind.upper()} ".join(repr(child) for child in self.children) + ")"
+
+
+class QuerySyntaxError(ValueError):
+    """A query string parse_query() cannot parse; the message says what is wrong with it."""
+
+
+def _query_tokens(query):
+    """Lex a query into (kind, value) pairs: field, phrase (word list), open, close, op, word."""
+    tokens = []
+    for match in QUERY_TOKEN_RE.finditer(query):
+        if match.group("field") is not None:
+            name = match.group("field").lower()
+            if name in QUERY_FIELDS:
+                tokens.append(("field", name))
+            else:
+                tokens.append(("word", name))  # Unknown field: just a word
+        elif match.group("phrase") is not None:
+            if not match.group().endswith('"') or match.end() - match.start() < 2:
+                raise QuerySyntaxError('missing closing "')
+            words = [term for term, _, _ in tokenize(match.group("phrase"))]
+            if not words:
+                raise QuerySyntaxError("empty phrase")
+            tokens.append(("phrase", words))
+        elif match.group("open") is not None:
+            tokens.append(("open", None))
+        elif match.group("close") is not None:
+            tokens.append(("close", None))
+        else:
+            word = match.group("word").lower()
+            tokens.append(("op" if word in QUERY_OPERATORS else "word", word))
+    return tokens
+
+
+class _QueryParser:
+    """
+    Recursive descent over _query_tokens(): or := and (OR and)*,
+    and := unary (AND? unary)*, unary := NOT unary | primary,
+    primary := field? (word | phrase | "(" or ")").
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def parse_or(self):
+        children = [self.parse_and()]
+        while self.peek() == ("op", "or"):
+            self.pos += 1
+            children.append(self.parse_and())
+        return QueryNode("or", children=children) if len(children) > 1 else children[0]
+
+    def parse_and(self):
+        children = [self.parse_unary()]
+        while True:
+            kind, value = self.peek()
+            if kind in (None, "close") or (kind, value) == ("op", "or"):
+                break
+            if (kind, value) == ("op", "and"):
+                self.pos += 1
+            children.append(self.parse_unary())
+        return QueryNode("and", children=children) if len(children) > 1 else children[0]
+
+    def parse_unary(self):
+        if self.peek() == ("op", "not"):
+            self.pos += 1
+            return QueryNode("not", children=[self.parse_unary()])
+        return self.parse_primary(None)
+
+    def parse_primary(self, field):
+        kind, value = self.peek()
+        if kind in (None, "close", "op"):
+            raise self.missing_term()
+        self.pos += 1
+        if kind == "field":
+            return self.parse_primary(QUERY_FIELDS[value])
+        if kind == "word":
+            return QueryNode("term", [value], field)
+        if kind == "phrase":
+            return QueryNode("phrase" if len(value) > 1 else "term", value, field)
+        node = self.parse_or()  # "("
+        if self.peek()[0] != "close":
+            raise QuerySyntaxError('missing ")"')
+        self.pos += 1
+        return _restrict(node, field) if field is not None else node
+
+    def missing_term(self):
+        """The error for a term expected at the current token but not found there."""
+        previous_kind, previous = self.tokens[self.pos - 1] if self.pos else (None, None)
+        kind, value = self.peek()
+        if previous_kind == "op":
+            return QuerySyntaxError(f"{previous.upper()} needs a term after it")
+        if previous_kind == "field":
+            return QuerySyntaxError(f"{previous}: needs a term after it")
+        if kind == "op":
+            return QuerySyntaxError(f"{value.upper()} needs a term before it")
+        if previous_kind == "open":
+            return QuerySyntaxError('empty "()"' if kind == "close" else 'missing ")"')
+        return QuerySyntaxError('unbalanced ")"')
+
+
+def _restrict(node, field):
+    """Apply a field filter to every term and phrase of a group that has none of its own."""
+    if node.kind in ("term", "phrase"):
+        if node.field is None:
+            node.field = field
+    else:
+        for child in node.children:
+            _restrict(child, field)
+    return node
+
+
+def parse_query(query):
+    """
+    Parse a query string (see the module docstring) into a QueryNode tree;
+    None if it has no terms. Raises QuerySyntaxError for a malformed query.
+    """
+    tokens = _query_tokens(query)
+    if not tokens:
+        return None
+    parser = _QueryParser(tokens)
+    node = parser.parse_or()
+    if parser.pos < len(tokens):
+        raise QuerySyntaxError('unbalanced ")"')
+    return node
+
+
+def match_spans(text, terms):
+    """(start, end) character ranges of the tokens of text whose lower-cased form is in terms."""
+    return [(start, end) for term, start, end in tokenize(text) if term in terms]
+
+
+def content_hash(documents):
+    """Hex digest of (doc_id, {field: text}) pairs; changes whenever any id, field or text does."""
+    digest = hashlib.blake2b(digest_size=16)
+    for doc_id, texts in documents:
+        digest.update(repr(doc_id).encode("utf-8") + b"\0")
+        for name in sorted(texts):
+            text = (texts[name] or "").encode("utf-8")
+            digest.update(f"{name}:{len(text)}:".encode("utf-8") + text)
+    return digest.hexdigest()
+
+
+def snippet(text, offset, length, radius=40):
+    """
+    One-line excerpt of text around text[offset:offset + length], with up to
+    radius characters of context on each side (cut at word boundaries).
+    """
+    start = max(0, offset - radius)
+    end = min(len(text), offset + length + radius)
+    if start > 0:
+        space = text.find(" ", start, offset)
+        start = space + 1 if space != -1 else start
+    if end < len(text):
+        space = text.rfind(" ", offset + length, end)
+        end = space if space != -1 else end
+    excerpt = " ".join(text[start:end].split())
+    return ("..." if start > 0 else "") + excerpt + ("..." if end < len(text) else "")
+
+
+class SearchHit:
+    """One ranked document: its id, BM25 score and the location of its best occurrence."""
+
+    __slots__ = ("doc_id", "score", "field", "offset", "length")
+
+    def __init__(self, doc_id, score, field, offset, length):
+        self.doc_id = doc_id
+        self.score = score
+        self.field = field    # Field holding the anchor occurrence (None if it has no offsets)
+        self.offset = offset  # Character offset of that occurrence in the field's text
+        self.length = length  # Length of the matched token
+
+    def __repr__(self):
+        return f"SearchHit({self.doc_id!r}, score={self.score:.3f}, field={self.field!r}, offset={self.offset})"
+
+
+class MappedPostings(Mapping):
+    """
+    Read-only term → postings mapping over a memory-mapped cache file.
+
+    terms is the sorted term list, starts[i]:starts[i + 1] the slice of the
+    uint32 postings buffer holding term i as repeated [doc, count of list 0,
+    values..., count of list 1, values..., ...] records, with list_count
+    lists per document (the offsets, then the positions, of every field).
+    Decoded postings are memoized.
+    """
+
+    def __init__(self, terms, starts, postings, list_count, buffer):
+        self._terms = terms
+        self._starts = starts
+        self._postings = postings
+        self._list_count = list_count
+        self._buffer = buffer  # Keeps the mmap alive for the postings memoryview
+        self._decoded = {}
+
+    def _position(self, term):
+        i = bisect_left(self._terms, term)
+        return i if i < len(self._terms) and self._terms[i] == term else -1
+
+    def __contains__(self, term):
+        return term in self._decoded or self._position(term) != -1
+
+    def __getitem__(self, term):
+        entry = self._decoded.get(term)
+        if entry is not None:
+            return entry
+        i = self._position(term)
+        if i == -1:
+            raise KeyError(term)
+        values = self._postings[self._starts[i]:self._starts[i + 1]].tolist()
+        entry = {}
+        pos = 0
+        while pos < len(values):
+            doc = values[pos]
+            pos += 1
+            offsets = []
+            for _ in range(self._list_count):
+                count = values[pos]
+                offsets.append(values[pos + 1:pos + 1 + count])
+                pos += 1 + count
+            entry[doc] = tuple(offsets)
+        self._decoded[term] = entry
+        return entry
+
+    def undecoded_size(self, term):
+        """Postings values a lookup of term still has to decode (0 once it is memoized or if it is absent)."""
+        if term in self._decoded:
+            return 0
+        i = self._position(term)
+        return self._starts[i + 1] - self._starts[i] if i != -1 else 0
+
+    def __iter__(self):
+        return iter(self._terms)
+
+    def __len__(self):
+        return len(self._terms)
+
+
+class InvertedIndex:
+    """
+    Per-field inverted index over a set of documents.
+
+    fields maps field name → BM25 weight. Documents are added with add(doc_id,
+    {field: text}); postings[term][doc] holds, for each field in order, the
+    list of character offsets where term occurs, followed by, for each field,
+    the matching list of token positions.
+    """
+
+    def __init__(self, fields, k1=1.2, b=0.75):
+        self.fields = list(fields)
+        self.weights = [fields[name] for name in self.fields]
+        self.k1 = k1
+        self.b = b
+        self.doc_ids = []
+        self._doc_lengths = []  # Per document: token count of each field
+        self._total_lengths = [0] * len(self.fields)
+        self._postings = {}
+        self._vocabulary = None  # Sorted term list, built on first prefix lookup
+
+    def __len__(self):
+        return len(self.doc_ids)
+
+    def add(self, doc_id, texts):
+        """Index one document. texts maps field name → text (missing fields are empty)."""
+        doc = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        lengths = []
+        field_count = len(self.fields)
+        list_count = 2 * field_count
+        if not isinstance(self._postings, dict):
+            # Loaded from a cache file: decode everything before extending it
+            self._postings = {term: self._postings[term] for term in self._postings}
+        postings = self._postings
+        for field_index, name in enumerate(self.fields):
+            field_terms = term_occurrences(texts.get(name) or "")
+            length = sum(len(starts) for starts, _ in field_terms.values())
+            lengths.append(length)
+            self._total_lengths[field_index] += length
+            for term, (starts, positions) in field_terms.items():
+                entry = postings.get(term)
+                if entry is None:
+                    entry = postings[term] = {}
+                offsets = entry.get(doc)
+                if offsets is None:
+                    offsets = entry[doc] = tuple([] for _ in range(list_count))
+                offsets[field_index].extend(starts)
+                offsets[field_count + field_index].extend(positions)
+        self._doc_lengths.append(lengths)
+        self._vocabulary = None
+        return doc
+
+    def vocabulary(self):
+        """All indexed terms, sorted."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        return self._vocabulary
+
+    def expand(self, term):
+        """Indexed terms matching a query term: the term itself, else the terms it is a prefix of."""
+        if term in self._postings:
+            return [term]
+        vocabulary = self.vocabulary()
+        matches = []
+        i = bisect_left(vocabulary, term)
+        while i < len(vocabulary) and vocabulary[i].startswith(term) and len(matches) < MAX_PREFIX_EXPANSION:
+            matches.append(vocabulary[i])
+            i += 1
+        return matches
+
+    def document_frequency(self, term):
+        return len(self._postings.get(term, ()))
+
+    def _field_docs(self, terms, field_index):
+        """Documents containing any of terms (in field field_index, or anywhere if None)."""
+        docs = set()
+        for term in terms:
+            entry = self._postings[term]
+            if field_index is None:
+                docs.update(entry)
+            else:
+                docs.update(doc for doc, offsets in entry.items() if offsets[field_index])
+        return docs
+
+    def _phrase_matches(self, words, field_index):
+        """
+        doc → (field index, offset, length) of the first occurrence of the words
+        at consecutive token positions (in field field_index, or any field if None).
+        """
+        entries = []
+        for word in words:
+            entry = self._postings.get(word)
+            if entry is None:
+                return {}
+            entries.append(entry)
+        field_count = len(self.fields)
+        # Content first, like the anchors of single terms
+        fields = range(field_count - 1, -1, -1) if field_index is None else (field_index,)
+        docs = set.intersection(*sorted((set(entry) for entry in entries), key=len))
+        matches = {}
+        for doc in docs:
+            lists = [entry[doc] for entry in entries]
+            for field in fields:
+                if not all(offsets[field] for offsets in lists):
+                    continue
+                # Positions where the phrase could start, narrowed word by word
+                starts = set(lists[0][field_count + field])
+                for i, offsets in enumerate(lists[1:], start=1):
+                    starts.intersection_update(position - i for position in offsets[field_count + field])
+                    if not starts:
+                        break
+                if starts:
+                    position = min(starts)
+                    first, last = lists[0], lists[-1]
+                    start = first[field][first[field_count + field].index(position)]
+                    end = last[field][last[field_count + field].index(position + len(words) - 1)] + len(words[-1])
+                    matches[doc] = (field, start, end - start)
+                    break
+        return matches
+
+    def _select(self, node, phrases):
+        """Set of documents matching a query node (posting-list set algebra). Fills phrases."""
+        if node.kind == "term":
+            field_index = self.fields.index(node.field) if node.field in self.fields else None
+            return self._field_docs(self.expand(node.terms[0]), field_index)
+        if node.kind == "phrase":
+            field_index = self.fields.index(node.field) if node.field in self.fields else None
+            matches = self._phrase_matches(node.terms, field_index)
+            phrases[id(node)] = matches
+            return set(matches)
+        if node.kind == "or":
+            docs = set()
+            for child in node.children:
+                docs |= self._select(child, phrases)
+            return docs
+        if node.kind == "not":
+            return set(range(len(self.doc_ids))) - self._select(node.children[0], phrases)
+        # AND: intersect the positive operands smallest first, then drop the negated ones
+        positive = [self._select(child, phrases) for child in node.children if child.kind != "not"]
+        negative = [child.children[0] for child in node.children if child.kind == "not"]
+        if positive:
+            docs = set.intersection(*sorted(positive, key=len))
+        else:
+            docs = set(range(len(self.doc_ids)))
+        for child in negative:
+            if not docs:
+                break
+            docs -= self._select(child, phrases)
+        return docs
+
+    def highlight_terms(self, query):
+        """Set of indexed terms the non-negated words of query match (after prefix expansion)."""
+        node = parse_query(query) if isinstance(query, str) else query
+        terms = set()
+        if node is None:
+            return terms
+        for leaf in node.leaves():
+            if leaf.kind == "phrase":
+                terms.update(leaf.terms)
+            else:
+                terms.update(self.expand(leaf.terms[0]))
+        return terms
+
+    def search_cost(self, query):
+        """
+        Rough cost of search(query), in postings values: per prefix-expanded
+        term, SEARCH_TERM_COST, plus the values still to decode from a mapped
+        cache file or SEARCH_DOC_COST per document of already decoded postings.
+        """
+        node = parse_query(query) if isinstance(query, str) else query
+        cost = 0
+        nodes = [node] if node is not None else []
+        while nodes:
+            node = nodes.pop()
+            if node.kind not in ("term", "phrase"):
+                nodes.extend(node.children)
+                continue
+            for term in node.terms if node.kind == "phrase" else self.expand(node.terms[0]):
+                cost += SEARCH_TERM_COST
+                undecoded = self._postings.undecoded_size(term) if isinstance(self._postings, MappedPostings) else 0
+                if undecoded:
+                    cost += undecoded
+                elif term in self._postings:
+                    cost += SEARCH_DOC_COST * len(self._postings[term])
+        return cost
+
+    def search(self, query, limit=None):
+        """
+        Rank the documents matching query (see parse_query) with field-weighted
+        BM25 over its non-negated terms. Returns a list of SearchHit, best first
+        (in index order if every term is negated). Raises QuerySyntaxError for
+        a malformed query.
+        """
+        node = parse_query(query) if isinstance(query, str) else query
+        if node is None or not self.doc_ids:
+            return []
+        phrases = {}
+        candidates = self._select(node, phrases)
+        if not candidates:
+            return []
+
+        n = len(self.doc_ids)
+        field_count = len(self.fields)
+        average = [max(1.0, total / n) for total in self._total_lengths]
+        k1, b = self.k1, self.b
+        scores = dict.fromkeys(candidates, 0.0)
+        anchors = {}
+        ranked_by = {}
+        for leaf in node.leaves():
+            ranked_by.setdefault((leaf.kind, tuple(leaf.terms), leaf.field), leaf)  # Repeated words count once
+        for leaf in ranked_by.values():
+            fields = range(field_count)
+            if leaf.field in self.fields:
+                fields = (self.fields.index(leaf.field),)
+            matches = phrases.get(id(leaf))
+            if matches:
+                # A phrase anchors on its first occurrence, ahead of any single term
+                for doc in candidates:
+                    match = matches.get(doc)
+                    if match is not None:
+                        anchors[doc] = (-1,) + match
+            terms = leaf.terms if leaf.kind == "phrase" else self.expand(leaf.terms[0])
+            for term in terms:
+                entry = self._postings.get(term)
+                if entry is None:
+                    continue
+                idf = math.log(1.0 + (n - len(entry) + 0.5) / (len(entry) + 0.5))
+                for doc in candidates:
+                    offsets = entry.get(doc)
+                    if offsets is None or (matches is not None and doc not in matches):
+                        continue
+                    lengths = self._doc_lengths[doc]
+                    score = 0.0
+                    for field_index in fields:
+                        tf = len(offsets[field_index])
+                        if tf:
+                            norm = 1.0 - b + b * lengths[field_index] / average[field_index]
+                            score += self.weights[field_index] * idf * tf * (k1 + 1.0) / (tf + k1 * norm)
+                    scores[doc] += score
+                    # Anchor on the rarest term's first occurrence, preferring content over tags over title
+                    anchor = anchors.get(doc)
+                    if anchor is None or len(entry) < anchor[0]:
+                        for field_index in reversed(fields):
+                            if offsets[field_index]:
+                                anchors[doc] = (len(entry), field_index, offsets[field_index][0], len(term))
+                                break
+        ranked = sorted(candidates, key=lambda doc: (-scores[doc], doc))
+        if limit is not None:
+            ranked = ranked[:limit]
+        hits = []
+        for doc in ranked:
+            anchor = anchors.get(doc)
+            if anchor is None:
+                hits.append(SearchHit(self.doc_ids[doc], scores[doc], None, -1, 0))
+            else:
+                hits.append(SearchHit(self.doc_ids[doc], scores[doc], self.fields[anchor[1]], anchor[2], anchor[3]))
+        return hits
+
+    def stats(self):
+        """Return a dictionary snapshot of the index size."""
+        return {
+            "documents": len(self.doc_ids),
+            "terms": len(self._postings),
+            "tokens": sum(self._total_lengths),
+            "mapped": not isinstance(self._postings, dict),
+        }
+
+    def save(self, path, source_hash):
+        """
+        Write the index to path, tagged with source_hash. Layout: magic, header
+        length, JSON header, newline-joined terms, padding to 4 bytes, then the
+        uint32 term start table and postings buffer (native byte order).
+        """
+        terms = self.vocabulary()
+        starts = array.array("I", [0])
+        postings = array.array("I")
+        for term in terms:
+            for doc, offsets in self._postings[term].items():
+                postings.append(doc)
+                for values in offsets:
+                    postings.append(len(values))
+                    postings.extend(values)
+            starts.append(len(postings))
+        terms_blob = "\n".join(terms).encode("utf-8")
+        header = json.dumps({
+            "version": CACHE_VERSION,
+            "hash": source_hash,
+            "byteorder": sys.byteorder,
+            "fields": dict(zip(self.fields, self.weights)),
+            "k1": self.k1,
+            "b": self.b,
+            "doc_ids": self.doc_ids,
+            "doc_lengths": self._doc_lengths,
+            "terms": len(terms),
+            "terms_bytes": len(terms_blob),
+        }).encode("utf-8")
+        head = CACHE_MAGIC + len(header).to_bytes(4, "little") + header + terms_blob
+        padding = b"\0" * (-len(head) % 4)
+        with open(path + ".tmp", "wb") as file:
+            file.write(head + padding)
+            starts.tofile(file)
+            postings.tofile(file)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path, source_hash):
+        """Memory-map an index saved with save(); None if missing, unreadable or built from other data."""
+        try:
+            with open(path, "rb") as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            if buffer[:4] != CACHE_MAGIC:
+                raise ValueError("bad magic")
+            header_length = int.from_bytes(buffer[4:8], "little")
+            header = json.loads(buffer[8:8 + header_length].decode("utf-8"))
+            if (header["version"] != CACHE_VERSION or header["hash"] != source_hash
+                    or header["byteorder"] != sys.byteorder):
+                raise ValueError("stale cache")
+            position = 8 + header_length
+            terms_blob = buffer[position:position + header["terms_bytes"]].decode("utf-8")
+            terms = terms_blob.split("\n") if header["terms"] else []
+            position += header["terms_bytes"]
+            position += -position % 4
+            starts_end = position + 4 * (header["terms"] + 1)
+            starts = array.array("I")
+            starts.frombytes(buffer[position:starts_end])
+            if len(terms) != header["terms"] or starts[-1] * 4 != len(buffer) - starts_end:
+                raise ValueError("truncated cache")
+        except (ValueError, KeyError, IndexError, TypeError):
+            buffer.close()
+            return None
+        postings = memoryview(buffer)[starts_end:].cast("I")
+        index = cls(header["fields"], k1=header["k1"], b=header["b"])
+        index.doc_ids = header["doc_ids"]
+        index._doc_lengths = header["doc_lengths"]
+        index._total_lengths = [sum(lengths[i] for lengths in index._doc_lengths) for i in range(len(index.fields))]
+        index._postings = MappedPostings(terms, starts, postings, 2 * len(index.fields), buffer)
+        index._vocabulary = terms
+        return index
+
+
+# Title hits rank above tag hits, which rank above body hits
+ESSAY_FIELDS = {"title": 3.0, "tags": 2.0, "content": 1.0}
+
+
+def essay_field_texts(essay):
+    """Field texts of an ESSAY_DATABASE entry (tags are joined one per line)."""
+    return {
+        "title": essay.get("title", ""),
+        "tags": "\n".join(essay.get("tags", [])),
+        "content": essay.get("content", ""),
+    }
+
+
+def build_essay_index(essay_database, extra_documents=None, cache_path=None):
+    """
+    Index every essay of essay_database by id over its title, tags and content,
+    plus extra_documents ({doc_id: essay-like dict}). With cache_path, reuse the
+    cached index if it was built from the same documents, else rebuild and save it.
+    """
+    documents = [(essay_id, essay_field_texts(essay)) for essay_id, essay in essay_database.items()]
+    if extra_documents:
+        documents.extend((doc_id, essay_field_texts(essay)) for doc_id, essay in extra_documents.items())
+    source_hash = None
+    if cache_path is not None:
+        source_hash = content_hash(documents)
+        index = InvertedIndex.load(cache_path, source_hash)
+        if index is not None:
+            return index
+    index = InvertedIndex(ESSAY_FIELDS)
+    for doc_id, texts in documents:
+        index.add(doc_id, texts)
+    index.vocabulary()  # Sort the term list now rather than on the first prefix query
+    if cache_path is not None:
+        try:
+            index.save(cache_path, source_hash)
+        except OSError as e:
+            print(f"Essay index cache not written: {e}")
+    return index
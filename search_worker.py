@@ -0,0 +1,142 @@
+"""
+Search Worker Module
+Background search thread that streams result batches back to the main loop.
+
+search_essays, `search` and `#` ran their whole search and formatted every
+result inside the KEYDOWN handler, so a heavy query (many hits, snippets
+cut out of essay bodies read from the essay pack) stalled the frame it was
+typed in. A SearchWorker runs searches on a daemon thread instead.
+
+A search is a generator function: it yields lists of lines (the header
+first, then formatted results in batches) and may return a final value
+(e.g. the hit list). A batch can also be yielded as a (lines, spans) pair,
+spans mapping the index of a line within the batch to the (start, end)
+character ranges of the hits in it, for highlighting. submit() queues it and makes it the current job;
+poll(), called once per frame by the main loop, returns the batches that
+have arrived for the current job, so the context window fills in
+progressively. Submitting a newer search, or calling cancel(), makes any
+in-flight job stale: the worker stops it at its next batch boundary and
+its pending batches are dropped.
+"""
+
+import itertools
+import queue
+import threading
+import traceback
+
+
+class SearchBatch:
+    """One message from the worker: a batch of lines, or the end of a job."""
+
+    __slots__ = ("job", "tag", "args", "lines", "spans", "first", "done", "result")
+
+    def __init__(self, job, tag, args, lines, first, done, result=None, spans=None):
+        self.job = job        # Job id returned by submit()
+        self.tag = tag        # Caller's label for the job (e.g. "essays", "search")
+        self.args = args      # Arguments the search was submitted with
+        self.lines = lines
+        self.spans = spans or {}  # Line index within the batch → [(start, end), ...] of hits
+        self.first = first    # First batch of the job
+        self.done = done      # Job finished; result holds the generator's return value
+        self.result = result
+
+
+class SearchWorker:
+    """Daemon thread running one search generator at a time; newer jobs cancel older ones."""
+
+    def __init__(self, name="search-worker"):
+        self.name = name
+        self._requests = queue.Queue()
+        self._results = queue.Queue()
+        self._ids = itertools.count(1)
+        self._current = 0  # Only this job's batches are delivered
+        self._thread = None
+        self.submitted = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.batches = 0
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def submit(self, tag, search, *args):
+        """Queue search(*args) as the current job, cancelling any other. Returns the job id."""
+        job = next(self._ids)
+        self._current = job
+        self.submitted += 1
+        self._ensure_thread()
+        self._requests.put((job, tag, search, args))
+        return job
+
+    def cancel(self):
+        """Make every queued or running job stale."""
+        self._current = next(self._ids)
+
+    @property
+    def current(self):
+        return self._current
+
+    def _run(self):
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            job, tag, search, args = request
+            if job != self._current:
+                self.cancelled += 1
+                continue
+            first = True
+            try:
+                batches = search(*args)
+                while True:
+                    if job != self._current:
+                        self.cancelled += 1
+                        batches.close()
+                        break
+                    try:
+                        lines = next(batches)
+                    except StopIteration as stop:
+                        self._results.put(SearchBatch(job, tag, args, [], first, True, stop.value))
+                        self.completed += 1
+                        break
+                    spans = None
+                    if isinstance(lines, tuple):
+                        lines, spans = lines
+                    self._results.put(SearchBatch(job, tag, args, lines, first, False, spans=spans))
+                    first = False
+            except Exception as e:
+                traceback.print_exc()
+                self._results.put(SearchBatch(job, tag, args, [f"Search failed: {e}"], first, True))
+
+    def poll(self, limit=8):
+        """Up to limit batches of the current job that have arrived (stale batches are discarded)."""
+        delivered = []
+        while len(delivered) < limit:
+            try:
+                batch = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if batch.job == self._current:
+                delivered.append(batch)
+                self.batches += 1
+        return delivered
+
+    def stop(self):
+        """Cancel everything and let the thread exit."""
+        self.cancel()
+        if self._thread is not None:
+            self._requests.put(None)
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def stats(self):
+        """Return a dictionary snapshot of the worker counters."""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "batches": self.batches,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
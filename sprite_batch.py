@@ -0,0 +1,90 @@
+"""
+Sprite Batch Module
+Collects (surface, dest) pairs per frame and submits them in one call per layer.
+
+Effect loops (matrix rain, Grid Bleed rain, NullParticles, celebration
+fireworks) used to call screen.blit once per sprite. A SpriteBatch gathers
+those pairs into named layers and hands each layer to Surface.fblits
+(pygame-ce) or Surface.blits (pygame) in a single call, which removes the
+per-call Python overhead from the hot loops.
+
+Layers are flushed explicitly by the caller at the point where the sprites
+belong in the draw order, so z-order is unchanged.
+"""
+
+import pygame  # type: ignore
+
+
+class SpriteBatch:
+    """Per-frame sprite submission queue with named layers."""
+
+    def __init__(self):
+        self._layers = {}
+        self.submit_calls = 0
+        self.sprites_submitted = 0
+
+    def add(self, layer, surface, dest):
+        """Queue one sprite on a layer. dest is a (x, y) position or a Rect."""
+        try:
+            self._layers[layer].append((surface, dest))
+        except KeyError:
+            self._layers[layer] = [(surface, dest)]
+
+    def extend(self, layer, pairs):
+        """Queue an iterable of (surface, dest) pairs on a layer."""
+        self._layers.setdefault(layer, []).extend(pairs)
+
+    def pending(self, layer):
+        """Number of sprites currently queued on a layer."""
+        return len(self._layers.get(layer, ()))
+
+    def flush(self, target, layer):
+        """Blit every queued sprite of a layer onto target in one call. Returns the sprite count."""
+        pairs = self._layers.get(layer)
+        if not pairs:
+            return 0
+        count = len(pairs)
+        fblits = getattr(target, "fblits", None)
+        if fblits is not None:
+            fblits(pairs)
+        else:
+            target.blits(pairs, doreturn=False)
+        pairs.clear()
+        self.submit_calls += 1
+        self.sprites_submitted += count
+        return count
+
+    def discard(self, layer=None):
+        """Drop queued sprites without drawing them (one layer, or all layers)."""
+        if layer is None:
+            for pairs in self._layers.values():
+                pairs.clear()
+        elif layer in self._layers:
+            self._layers[layer].clear()
+
+    def stats(self):
+        """Return a dictionary snapshot of the batch counters."""
+        return {"submit_calls": self.submit_calls, "sprites_submitted": self.sprites_submitted}
+
+
+class SpriteCache:
+    """Bounded cache of pre-built sprite surfaces keyed by any hashable key."""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self._sprites = {}
+
+    def get(self, key, factory):
+        """Return the sprite for key, building it with factory(*key) on first use."""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            if len(self._sprites) >= self.max_entries:
+                self._sprites.clear()
+            sprite = factory(*key)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[key] = sprite
+        return sprite
+
+    def __len__(self):
+        return len(self._sprites)
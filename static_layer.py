@@ -0,0 +1,68 @@
+"""
+Static Layer Module
+Retained offscreen surfaces for dashboard elements that never animate.
+
+Panel backgrounds, panel frames and titles and the link bar text used to be
+drawn again on every dashboard frame, and each translucent panel allocated
+its own temporary surface to do it. A StaticLayer renders those elements
+once into a screen-sized per-pixel-alpha surface. The dashboard then blits
+that one surface each frame and draws only the animated content on top.
+
+The layer is rebuilt only when its key changes (resolution or palette).
+
+gradient_ramp() serves the same purpose for the metallic button gradients:
+the per-row brightness ramp is rendered once and added onto the pulsing
+base color with BLEND_RGB_ADD, instead of drawing one line per row.
+"""
+
+import pygame  # type: ignore
+
+
+class StaticLayer:
+    """Offscreen surface built once by a builder function and reused until its key changes."""
+
+    def __init__(self, builder):
+        # builder(surface) draws the static elements onto a cleared SRCALPHA surface
+        self.builder = builder
+        self._surface = None
+        self._key = None
+        self.rebuilds = 0
+
+    def get(self, size, key=None):
+        """Return the layer for this size and key, rebuilding it if either changed."""
+        full_key = (tuple(size), key)
+        if self._surface is None or full_key != self._key:
+            self._surface = pygame.Surface(size, pygame.SRCALPHA)
+            self.builder(self._surface)
+            if pygame.display.get_surface() is not None:
+                self._surface = self._surface.convert_alpha()
+            self._key = full_key
+            self.rebuilds += 1
+        return self._surface
+
+    def invalidate(self):
+        """Force a rebuild on the next get()."""
+        self._surface = None
+
+
+_RAMPS = {}
+
+
+def gradient_ramp(size, scale, offset=0):
+    """
+    Return a cached opaque surface whose row i holds the gray value
+    int(offset + scale * (1 - i / height)): brightest at the top, offset at
+    the bottom. Blitting it with BLEND_RGB_ADD over a solid fill reproduces
+    min(255, color + int(offset + scale * ratio)) per row.
+    """
+    key = (tuple(size), scale, offset)
+    ramp = _RAMPS.get(key)
+    if ramp is None:
+        width, height = size
+        ramp = pygame.Surface(size)
+        for i in range(height):
+            gradient_ratio = 1.0 - (i / height)  # 1.0 at top, 0.0 at bottom
+            value = min(255, int(scale * gradient_ratio + offset))
+            ramp.fill((value, value, value), (0, i, width, 1))
+        _RAMPS[key] = ramp
+    return ramp
@@ -0,0 +1,92 @@
+"""
+Surface Pool Module
+Reusable scratch surfaces for per-frame effects, plus blend-flag tints.
+
+Full-screen effects (command flashes and pulses, the WR MEGA fire/lava/ice
+layer) used to allocate a new screen-sized SRCALPHA surface every frame, and
+particle bursts allocated one small surface per particle. A SurfacePool
+hands out surfaces keyed by (size, flags) and takes them all back at the end
+of the frame, so steady-state frames allocate nothing.
+
+Flat translucent tints do not need a scratch surface at all: fill_tint()
+applies them with two blend-flag fills on the target.
+
+Allocation counters are kept so the number of surface creations per frame
+can be checked (see SurfacePool.end_frame / SurfacePool.stats).
+"""
+
+import pygame  # type: ignore
+
+
+class SurfacePool:
+    """Per-frame pool of scratch surfaces keyed by (size, flags)."""
+
+    def __init__(self, max_per_key=4):
+        self.max_per_key = max_per_key
+        self._free = {}
+        self._in_use = []
+        self.allocations = 0
+        self.reuses = 0
+        # Surfaces created since the last end_frame() call
+        self.frame_allocations = 0
+        self.last_frame_allocations = 0
+
+    def acquire(self, size, flags=0, clear=None):
+        """
+        Return a scratch surface of this size and flags for the rest of the frame.
+
+        clear: optional color to fill it with first (e.g. (0, 0, 0, 0) for an empty alpha layer).
+        """
+        key = (int(size[0]), int(size[1]), flags)
+        free = self._free.get(key)
+        if free:
+            surf = free.pop()
+            self.reuses += 1
+        else:
+            surf = pygame.Surface(key[:2], flags)
+            self.allocations += 1
+            self.frame_allocations += 1
+        self._in_use.append((key, surf))
+        if clear is not None:
+            surf.fill(clear)
+        return surf
+
+    def end_frame(self):
+        """Return every acquired surface to the pool. Returns surfaces created this frame."""
+        for key, surf in self._in_use:
+            free = self._free.setdefault(key, [])
+            if len(free) < self.max_per_key:
+                free.append(surf)
+        self._in_use.clear()
+        self.last_frame_allocations = self.frame_allocations
+        self.frame_allocations = 0
+        return self.last_frame_allocations
+
+    def stats(self):
+        """Return a dictionary snapshot of the pool counters."""
+        return {
+            "pooled": sum(len(free) for free in self._free.values()),
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "last_frame_allocations": self.last_frame_allocations,
+        }
+
+    def clear(self):
+        """Drop every pooled surface (counters are kept)."""
+        self._free.clear()
+
+
+def fill_tint(surface, color, alpha, rect=None):
+    """
+    Blend a flat color over surface (or rect of it) at the given alpha.
+
+    Same result as blitting an SRCALPHA surface filled with (*color, alpha),
+    within rounding, but done in place with a multiply and an add fill.
+    """
+    if alpha <= 0:
+        return
+    alpha = min(255, int(alpha))
+    keep = 255 - alpha
+    if keep < 255:
+        surface.fill((keep, keep, keep), rect, special_flags=pygame.BLEND_RGB_MULT)
+    surface.fill(tuple(c * alpha // 255 for c in color[:3]), rect, special_flags=pygame.BLEND_RGB_ADD)
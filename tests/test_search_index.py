@@ -0,0 +1,134 @@
+"""
+Query parser and search tests for search_index.
+
+Run from the repository root: python -m pytest tests
+"""
+
+import pytest
+
+from search_index import InvertedIndex, QuerySyntaxError, parse_query
+
+DOCUMENTS = {
+    "001": {"title": "Legal Name Fraud", "tags": "legal\nfraud", "content": "The legal name is a fiction of the state."},
+    "002": {"title": "Maritime Law", "tags": "admiralty", "content": "Admiralty courts apply maritime law at sea."},
+    "003": {"title": "Truth", "tags": "truth", "content": "The truth about the name: a name is not a person."},
+    "004": {"title": "Justice", "tags": "law", "content": "Justice and truth, not fraud, under the law."},
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    index = InvertedIndex({"title": 3.0, "tags": 2.0, "content": 1.0})
+    for doc_id, texts in DOCUMENTS.items():
+        index.add(doc_id, texts)
+    return index
+
+
+def ids(hits):
+    return sorted(hit.doc_id for hit in hits)
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("truth", "truth"),
+    ("Maritime LAW", "(maritime AND law)"),
+    ("maritime AND law", "(maritime AND law)"),
+    ('"legal name fraud"', '"legal name fraud"'),
+    ('"Truth"', "truth"),  # A one-word phrase is a term
+    ('"not"', "not"),  # Quoting an operator searches for the word
+    ("tag:legal", "tags:legal"),
+    ("tags:legal", "tags:legal"),
+    ('title:"legal name"', 'title:"legal name"'),
+    ("tag:(legal OR law) name", "((tags:legal OR tags:law) AND name)"),
+    ("tag:(title:truth OR law)", "(title:truth OR tags:law)"),  # A term's own filter wins over its group's
+    ("foo:bar", "(foo AND bar)"),  # Unknown field: a plain word
+])
+def test_parse_terms_phrases_and_fields(query, expected):
+    assert repr(parse_query(query)) == expected
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("a OR b c", "(a OR (b AND c))"),  # AND binds tighter than OR
+    ("a b OR c", "((a AND b) OR c)"),
+    ("(a OR b) c", "((a OR b) AND c)"),
+    ("a OR b OR c", "(a OR b OR c)"),
+    ("NOT a b", "(NOT a AND b)"),  # NOT binds tighter than AND
+    ("a AND NOT b", "(a AND NOT b)"),
+    ("NOT (a OR b)", "NOT (a OR b)"),
+    ("NOT NOT a", "NOT NOT a"),
+    ("a or b", "(a OR b)"),  # Operators are case-insensitive
+])
+def test_parse_precedence(query, expected):
+    assert repr(parse_query(query)) == expected
+
+
+@pytest.mark.parametrize("query", ["", "   ", "!!", "-"])
+def test_parse_query_without_terms(query):
+    assert parse_query(query) is None
+
+
+@pytest.mark.parametrize("query, message", [
+    ("(", 'missing ")"'),
+    ("(a OR b", 'missing ")"'),
+    ("()", 'empty "()"'),
+    ("a)", 'unbalanced ")"'),
+    (")", 'unbalanced ")"'),
+    ('"', 'missing closing "'),
+    ('"legal name', 'missing closing "'),
+    ('""', "empty phrase"),
+    ('"!!"', "empty phrase"),
+    ("tag:", "tag: needs a term after it"),
+    ("title: OR a", "title: needs a term after it"),
+    ("truth AND", "AND needs a term after it"),
+    ("truth OR", "OR needs a term after it"),
+    ("truth NOT", "NOT needs a term after it"),
+    ("NOT", "NOT needs a term after it"),
+    ("OR truth", "OR needs a term before it"),
+    ("AND truth", "AND needs a term before it"),
+    ("a AND OR b", "AND needs a term after it"),
+    ("(OR a)", "OR needs a term before it"),
+])
+def test_parse_malformed(query, message):
+    with pytest.raises(QuerySyntaxError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        parse_query(query)
+
+
+def test_search_malformed_raises(index):
+    with pytest.raises(QuerySyntaxError):
+        index.search("truth AND")
+    with pytest.raises(QuerySyntaxError):
+        index.search_cost("tag:")
+
+
+def test_search_boolean(index):
+    assert ids(index.search("truth")) == ["003", "004"]
+    assert ids(index.search("maritime OR fraud")) == ["001", "002", "004"]
+    assert ids(index.search("name NOT fraud")) == ["003"]
+    assert ids(index.search("(truth OR maritime) law")) == ["002", "004"]
+
+
+def test_search_not_only_lists_every_other_document(index):
+    hits = index.search("NOT truth")
+    assert [hit.doc_id for hit in hits] == ["001", "002"]  # Nothing to rank by: index order
+    assert all(hit.score == 0.0 for hit in hits)
+
+
+def test_search_phrases_and_fields(index):
+    assert ids(index.search('"legal name"')) == ["001"]
+    assert ids(index.search('"name legal"')) == []
+    assert ids(index.search("tag:law")) == ["004"]
+    assert ids(index.search("title:law")) == ["002"]
+    assert ids(index.search('title:"legal name"')) == ["001"]
+    hit = index.search('"maritime law"')[0]
+    assert (hit.field, DOCUMENTS[hit.doc_id]["content"][hit.offset:hit.offset + hit.length]) == \
+        ("content", "maritime law")
+
+
+def test_search_prefix_and_ranking(index):
+    assert ids(index.search("mari")) == ["002"]  # Prefix of maritime
+    assert index.search("law")[0].doc_id == "002"  # A title hit outranks a tag hit
+
+
+def test_search_cost(index):
+    assert index.search_cost("") == 0
+    assert index.search_cost("zzz") == 0
+    assert 0 < index.search_cost("law") < index.search_cost("law OR truth")
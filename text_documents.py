@@ -0,0 +1,144 @@
+"""
+Text Documents Module
+Cached line arrays of the plain-text documents, reloaded only when a file changes.
+
+GridBleed.txt and CRSS.txt were read once at startup, and then every
+`essay gridbleed`, `essay crss`, `crss`, `search_essays gridbleed` and essays
+screen click opened the file again, read it whole and split it into lines
+before putting them into the context window.
+
+A DocumentStore holds each registered text file as a list of lines. Asking
+for a document stats the file and only reads it again when its mtime or
+size changed since the last read, so edits to a text file still show up
+without a restart. If the file is gone, FileNotFoundError is raised like
+open() did, and the last lines read are dropped.
+
+view() returns a LineView: a read-only sequence of a few header lines
+followed by a range of the document's lines. It indexes into the store's
+line list instead of copying it, and the same view object is handed out
+again while the file is unchanged, so layouts cached for the context window
+(keyed by the content object) are reused when a document is reopened.
+"""
+
+import os
+from collections.abc import Sequence
+
+
+class LineView(Sequence):
+    """Read-only header + lines[start:stop] sequence that does not copy the lines."""
+
+    __slots__ = ("header", "lines", "start", "stop")
+
+    def __init__(self, lines, start=0, stop=None, header=()):
+        self.header = tuple(header)
+        self.lines = lines
+        self.start = max(0, min(start, len(lines)))
+        self.stop = len(lines) if stop is None else max(self.start, min(stop, len(lines)))
+
+    def __len__(self):
+        return len(self.header) + self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        if index < len(self.header):
+            return self.header[index]
+        return self.lines[self.start + index - len(self.header)]
+
+    def __iter__(self):
+        yield from self.header
+        for i in range(self.start, self.stop):
+            yield self.lines[i]
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __repr__(self):
+        return f"LineView({len(self.header)} header + lines {self.start}:{self.stop})"
+
+
+class TextDocument:
+    """One text file: its title and its lines as of the last time it was read."""
+
+    __slots__ = ("name", "path", "title", "lines", "signature", "loads", "_views")
+
+    def __init__(self, name, path, title):
+        self.name = name
+        self.path = path
+        self.title = title
+        self.lines = None
+        self.signature = None  # (mtime_ns, size) of the file when lines were read
+        self.loads = 0
+        self._views = {}
+
+    def refresh(self):
+        """Re-read the file if it changed since the last read. Raises FileNotFoundError if it is missing."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self.lines = None
+            self.signature = None
+            self._views.clear()
+            raise
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self.signature or self.lines is None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.lines = f.read().split('\n')
+            self.signature = signature
+            self.loads += 1
+            self._views.clear()  # Views of the old lines stay valid for whoever holds them
+        return self
+
+    @property
+    def text(self):
+        return '\n'.join(self.lines)
+
+    def view(self, header=(), start=0, stop=None):
+        """LineView of header lines followed by lines[start:stop], shared while the file is unchanged."""
+        key = (tuple(header), start, stop)
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = LineView(self.lines, start, stop, header)
+        return view
+
+
+class DocumentStore:
+    """Named text files under one directory, served as line views."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._documents = {}
+        self.requests = 0
+
+    def register(self, name, filename, title):
+        """Add a text file (relative to the store directory) under name. The file is read on first use."""
+        self._documents[name] = TextDocument(name, os.path.join(self.directory, filename), title)
+
+    def __contains__(self, name):
+        return name in self._documents
+
+    def get(self, name):
+        """The up-to-date TextDocument for name (KeyError if unregistered, FileNotFoundError if missing)."""
+        self.requests += 1
+        return self._documents[name].refresh()
+
+    def text(self, name):
+        return self.get(name).text
+
+    def view(self, name, header=(), start=0, stop=None):
+        """LineView of header lines followed by lines[start:stop] of the document."""
+        return self.get(name).view(header, start, stop)
+
+    def stats(self):
+        """Return a dictionary snapshot of the store."""
+        return {
+            "documents": len(self._documents),
+            "loaded": sum(1 for document in self._documents.values() if document.lines is not None),
+            "lines": sum(len(document.lines) for document in self._documents.values() if document.lines is not None),
+            "loads": sum(document.loads for document in self._documents.values()),
+            "requests": self.requests,
+        }
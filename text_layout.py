@@ -0,0 +1,292 @@
+"""
+Text Layout Module
+Cached word wrapping and line-surface rendering for the context window.
+
+render_context_window_content used to re-wrap every visible line word by word
+(one font.size() call per word) and render fresh surfaces every frame. A
+TextLayout wraps each logical line once, stores the wrapped segments with
+their character offsets, and keeps rendered segment surfaces in a bounded
+LRU so a steady frame only blits cached surfaces.
+
+Layouts are keyed by (content version, width, font size). The context window
+replaces context_window_content with a new list whenever it changes, so the
+list object itself is the content version.
+
+Mouse hit testing uses the same layout: each segment gets a cumulative glyph
+advance array (built once from Font.metrics), so mapping an x position to a
+character is a binary search instead of measuring every prefix.
+
+Search hit highlighting uses the same advances in the other direction: a
+HitHighlights holds the (start, end) character ranges the search computed
+for each result line, and span_boxes() turns a range into x extents within
+the wrapped segments. Jumping between hits is a bisect over the sorted hit
+line numbers.
+"""
+
+import re
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+
+
+class WrappedSegment:
+    """One visual row of a wrapped logical line."""
+
+    __slots__ = ("line_index", "start_char", "text")
+
+    def __init__(self, line_index, start_char, text):
+        self.line_index = line_index
+        self.start_char = start_char  # Offset of text[0] within the logical line
+        self.text = text
+
+    @property
+    def end_char(self):
+        return self.start_char + len(self.text)
+
+
+class TextLayout:
+    """Lazily wrapped view of a list of lines for one font and width."""
+
+    def __init__(self, content_list, font, max_width, color_for_line, max_surfaces=256):
+        self.content = content_list
+        self.font = font
+        self.max_width = max_width
+        self.color_for_line = color_for_line
+        self.max_surfaces = max_surfaces
+        self._segments = {}
+        self._colors = {}
+        self._surfaces = OrderedDict()
+        self._advances = {}
+        self._words = {}
+        self._boxes = {}
+
+    def segments(self, line_index):
+        """Return the wrapped segments of a logical line (wrapping it on first use)."""
+        segments = self._segments.get(line_index)
+        if segments is None:
+            segments = self._wrap(line_index)
+            self._segments[line_index] = segments
+        return segments
+
+    def line_color(self, line_index):
+        """Color of a logical line, as decided by color_for_line."""
+        color = self._colors.get(line_index)
+        if color is None:
+            color = self.color_for_line(self.content[line_index])
+            self._colors[line_index] = color
+        return color
+
+    def segment_surface(self, line_index, seg_index):
+        """Return the rendered surface of one segment in its line color (LRU cached)."""
+        key = (line_index, seg_index)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            return surf
+        segment = self.segments(line_index)[seg_index]
+        surf = self.font.render(segment.text, True, self.line_color(line_index))
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_surfaces:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def advances(self, line_index, seg_index):
+        """
+        Cumulative glyph advances of a segment: advances[i] is the x offset of
+        the right edge of character i, measured from the segment's left edge.
+        """
+        key = (line_index, seg_index)
+        advances = self._advances.get(key)
+        if advances is None:
+            advances = self._measure(self.segments(line_index)[seg_index].text)
+            self._advances[key] = advances
+        return advances
+
+    def row_at(self, first_line, row):
+        """
+        Map a visual row (counted from the top of first_line) to a wrapped segment.
+
+        Returns (line_index, seg_index), with seg_index None for an empty line,
+        or None when the row lies below the last line.
+        """
+        if row < 0:
+            return None
+        for line_index in range(first_line, len(self.content)):
+            rows = len(self.segments(line_index)) or 1  # Empty lines still take one row
+            if row < rows:
+                return (line_index, row if self.segments(line_index) else None)
+            row -= rows
+        return None
+
+    def char_at(self, line_index, seg_index, x):
+        """Index (within the logical line) of the character under x, relative to the segment's left edge."""
+        segment = self.segments(line_index)[seg_index]
+        if x < 0:
+            return segment.start_char
+        return segment.start_char + bisect_right(self.advances(line_index, seg_index), x)
+
+    def _collapsed_offset(self, line_index, char):
+        # Segments join words with single spaces, so offsets past a run of
+        # spaces move left; map an offset in the logical line to that form.
+        words = self._words.get(line_index)
+        if words is None:
+            words = ([], [], [])  # Start in the line, start in the segments, length
+            collapsed = 0
+            for match in re.finditer(r"\S+", self.content[line_index]):
+                words[0].append(match.start())
+                words[1].append(collapsed)
+                words[2].append(len(match.group()))
+                collapsed += len(match.group()) + 1
+            self._words[line_index] = words
+        i = bisect_right(words[0], char) - 1
+        if i < 0:
+            return 0
+        return words[1][i] + min(char - words[0][i], words[2][i])
+
+    def span_boxes(self, line_index, start, end):
+        """
+        (seg_index, x0, x1) pieces of the characters start:end of a logical line,
+        x measured from each segment's left edge (cached per span).
+        """
+        key = (line_index, start, end)
+        boxes = self._boxes.get(key)
+        if boxes is not None:
+            return boxes
+        boxes = []
+        first = self._collapsed_offset(line_index, start)
+        last = self._collapsed_offset(line_index, end - 1) + 1
+        for seg_index, segment in enumerate(self.segments(line_index)):
+            seg_start = max(first, segment.start_char)
+            seg_end = min(last, segment.end_char)
+            if seg_start >= seg_end:
+                continue
+            advances = self.advances(line_index, seg_index)
+            x0 = advances[seg_start - segment.start_char - 1] if seg_start > segment.start_char else 0
+            boxes.append((seg_index, x0, advances[seg_end - segment.start_char - 1]))
+        self._boxes[key] = boxes
+        return boxes
+
+    def _measure(self, text):
+        # Font.metrics advances are whole pixels and ignore kerning, so they
+        # drift from what font.render draws over a long segment. Each word end
+        # is anchored to its exact font.size() prefix width and the metrics
+        # advances are only used to spread that width over the word's glyphs.
+        pen = []
+        x = 0
+        for char, metric in zip(text, self.font.metrics(text)):
+            # metrics() gives None for glyphs the font does not have
+            x += metric[4] if metric is not None else self.font.size(char)[0]
+            pen.append(x)
+        advances = [0] * len(text)
+        start = 0
+        prev_pen = 0
+        prev_x = 0
+        for end in range(len(text)):
+            if end + 1 < len(text) and text[end + 1] != " ":
+                continue
+            anchor_x = self.font.size(text[:end + 1])[0]
+            span = pen[end] - prev_pen
+            for i in range(start, end + 1):
+                if span:
+                    advances[i] = prev_x + (pen[i] - prev_pen) * (anchor_x - prev_x) / span
+                else:
+                    advances[i] = anchor_x
+            start = end + 1
+            prev_pen = pen[end]
+            prev_x = anchor_x
+        return advances
+
+    def _wrap(self, line_index):
+        # Same greedy word wrap the context window has always used: words are
+        # joined by single spaces and a segment breaks when "<segment> " no
+        # longer fits in max_width.
+        words = self.content[line_index].split()
+        segments = []
+        current_line = ""
+        start_char = 0
+        for word in words:
+            test_line = current_line + word + " " if current_line else word + " "
+            if self.font.size(test_line)[0] < self.max_width:
+                current_line = test_line
+            else:
+                if current_line:
+                    text = current_line.strip()
+                    segments.append(WrappedSegment(line_index, start_char, text))
+                    start_char += len(text) + 1  # +1 for the collapsed space
+                current_line = word + " "
+        if current_line:
+            segments.append(WrappedSegment(line_index, start_char, current_line.strip()))
+        return segments
+
+
+class TextLayoutCache:
+    """Holds the most recently used TextLayouts keyed by (content version, width, font size)."""
+
+    def __init__(self, max_layouts=4):
+        self.max_layouts = max_layouts
+        self._layouts = OrderedDict()
+
+    def get(self, content_list, max_width, font_size, font, color_for_line):
+        """Return the layout for this content/width/size, building it if the content changed."""
+        key = (id(content_list), max_width, font_size)
+        layout = self._layouts.get(key)
+        # The layout keeps a reference to its list, so a matching id with a
+        # different object can only happen after that layout was dropped.
+        if layout is not None and layout.content is content_list and layout.font is font:
+            self._layouts.move_to_end(key)
+            return layout
+        layout = TextLayout(content_list, font, max_width, color_for_line)
+        self._layouts[key] = layout
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def clear(self):
+        self._layouts.clear()
+
+
+class HitHighlights:
+    """
+    Search hit ranges of one context window content: line index → [(start, end)],
+    plus the sorted hit lines and the hit last jumped to.
+    """
+
+    def __init__(self, content):
+        self.content = content  # The content the ranges belong to; rebound as streamed batches arrive
+        self.spans = {}
+        self.lines = []
+        self.current = None  # Index into lines of the hit last jumped to
+
+    def __len__(self):
+        return len(self.lines)
+
+    def add(self, line_index, spans):
+        if not spans:
+            return
+        if line_index not in self.spans:
+            insort(self.lines, line_index)
+        self.spans[line_index] = list(spans)
+
+    def extend(self, first_line, batch_spans):
+        """Add the spans of a batch of lines that starts at first_line."""
+        for offset, spans in batch_spans.items():
+            self.add(first_line + offset, spans)
+
+    def step(self, direction, from_line=0):
+        """
+        Line of the next (direction 1) or previous (-1) hit, wrapping around.
+        The first jump starts from from_line (e.g. the first visible line).
+        """
+        if not self.lines:
+            return None
+        if self.current is None:
+            if direction > 0:
+                self.current = bisect_left(self.lines, from_line) % len(self.lines)
+            else:
+                self.current = (bisect_right(self.lines, from_line) - 1) % len(self.lines)
+        else:
+            self.current = (self.current + direction) % len(self.lines)
+        return self.lines[self.current]
+
+    def current_line(self):
+        return self.lines[self.current] if self.current is not None else None
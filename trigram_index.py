@@ -0,0 +1,151 @@
+"""
+Trigram Index Module
+Typo-tolerant term lookup: character trigrams plus edit-distance verification.
+
+A misspelled query ("admirality", "soverign") matches nothing in the essay
+index, and comparing it against every word of the 1.7 MB corpus would cost
+a full scan per query. A TrigramIndex is built over the vocabulary instead
+(every distinct term of the essays and the lore collections): each term is
+split into the character trigrams of "$term$", and each trigram maps to the
+terms containing it.
+
+A lookup only touches the postings of the query's own trigrams. A term within
+edit distance k of the query shares at least len(grams) - 3k of them, so
+counting shared trigrams narrows the vocabulary down to a few candidates,
+which are then checked with a bounded Levenshtein distance. correct() applies
+that to every unknown word of a query, leaving the query syntax alone.
+
+The postings are built on first use, so the cost is paid by the first
+fuzzy lookup (on the search worker thread), not at startup.
+"""
+
+from bisect import bisect_left
+
+from search_index import QUERY_OPERATORS, TOKEN_RE
+
+
+def trigrams(word):
+    """Character trigrams of word, padded with '$' at both ends (duplicates kept once)."""
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance of a and b, or limit + 1 as soon as it must exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        best = i
+        for j, char_b in enumerate(b, start=1):
+            cost = previous[j - 1] + (char_a != char_b)
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            current.append(cost)
+            best = min(best, cost)
+        if best > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def max_distance(word):
+    """Edits tolerated for a word of this length (short words would match too much)."""
+    if len(word) <= 3:
+        return 0
+    if len(word) <= 6:
+        return 1
+    return 2
+
+
+class TrigramIndex:
+    """Trigram → term postings over a sorted vocabulary, with bounded edit-distance verification."""
+
+    def __init__(self, terms):
+        self.terms = sorted(set(terms))
+        self._postings = None
+        self.lookups = 0
+        self.verified = 0
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, term):
+        i = bisect_left(self.terms, term)
+        return i < len(self.terms) and self.terms[i] == term
+
+    def _build(self):
+        postings = {}
+        for term_id, term in enumerate(self.terms):
+            for gram in trigrams(term):
+                postings.setdefault(gram, []).append(term_id)
+        self._postings = postings
+
+    def has_prefix(self, prefix):
+        i = bisect_left(self.terms, prefix)
+        return i < len(self.terms) and self.terms[i].startswith(prefix)
+
+    def similar(self, word, limit=None, max_results=5):
+        """
+        Vocabulary terms within `limit` edits of word (default: max_distance(word)),
+        as (term, distance) pairs, closest first.
+        """
+        if self._postings is None:
+            self._build()
+        self.lookups += 1
+        if limit is None:
+            limit = max_distance(word)
+        grams = trigrams(word)
+        shared = {}
+        for gram in grams:
+            for term_id in self._postings.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+        # One edit first: it needs more shared trigrams, so far fewer candidates get verified
+        for distance_limit in range(1, limit + 1):
+            needed = max(1, len(grams) - 3 * distance_limit)
+            matches = []
+            for term_id, count in shared.items():
+                if count < needed:
+                    continue
+                term = self.terms[term_id]
+                if abs(len(term) - len(word)) > distance_limit:
+                    continue
+                self.verified += 1
+                distance = edit_distance(word, term, distance_limit)
+                if distance <= distance_limit:
+                    matches.append((term, distance))
+            if matches:
+                matches.sort(key=lambda match: (match[1], abs(len(match[0]) - len(word)), match[0]))
+                return matches[:max_results]
+        return []
+
+    def correct(self, query):
+        """
+        query with every word that is neither a known term nor a prefix of one
+        replaced by its closest vocabulary term. Query syntax (quotes, field
+        filters, AND/OR/NOT) is kept as typed. None if nothing was replaced.
+        """
+        corrected = []
+        end = 0
+        for match in TOKEN_RE.finditer(query):
+            word = match.group().lower()
+            if (word in QUERY_OPERATORS or query.startswith(":", match.end())
+                    or word in self or self.has_prefix(word)):
+                continue
+            matches = self.similar(word, max_results=1)
+            if matches:
+                corrected.append(query[end:match.start()] + matches[0][0])
+                end = match.end()
+        if not corrected:
+            return None
+        return "".join(corrected) + query[end:]
+
+    def stats(self):
+        """Return a dictionary snapshot of the index."""
+        return {
+            "terms": len(self.terms),
+            "trigrams": len(self._postings) if self._postings is not None else 0,
+            "built": self._postings is not None,
+            "lookups": self.lookups,
+            "verified": self.verified,
+        }